@@ -0,0 +1,58 @@
+"""
+Замер памяти на одного клиента: компактный Client (__slots__)
+в сравнении с прежним представлением через __dict__.
+
+Запуск: python -m benchmarks.bench_client_memory [количество]
+"""
+import sys
+import tracemalloc
+from datetime import date
+
+from travel_agency.Client import Client
+
+
+class _DictClient:
+    """Прежняя раскладка Client: девять атрибутов в __dict__ экземпляра"""
+
+    def __init__(self, id, surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance):
+        self._id = id
+        self._surname = surname
+        self._firstname = firstname
+        self._fathers_name = fathers_name
+        self._birth_date = birth_date
+        self._phone_number = phone_number
+        self._pasport = pasport
+        self._email = email
+        self._balance = balance
+
+
+def _row(i: int) -> tuple:
+    # Строковые значения общие для всех объектов, поэтому замер показывает
+    # накладные расходы самого объекта, а не размер данных
+    return (i, "Иванов", "Иван", "Иванович", date(1990, 5, 15), "+79991234567", "1234 567890", "ivanov@mail.ru", 5000.0)
+
+
+def measure(factory, count: int) -> float:
+    """Средний объем памяти в байтах на один созданный объект"""
+    rows = [_row(i) for i in range(count)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [factory(*row) for row in rows]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Список ссылок тоже занимает память - вычитаем его
+    return (after - before - sys.getsizeof(objects)) / len(objects)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    dict_bytes = measure(_DictClient, count)
+    slots_bytes = measure(Client.from_trusted, count)
+    print(f"Клиентов: {count}")
+    print(f"__dict__ (до):  {dict_bytes:8.1f} байт/клиент")
+    print(f"__slots__ (после): {slots_bytes:8.1f} байт/клиент")
+    print(f"Экономия: {(1 - slots_bytes / dict_bytes) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Время записи и чтения Client_rep_yaml: libyaml (CSafeLoader/CSafeDumper) в сравнении
+с реализацией на чистом Python, для одного документа со списком и для потока документов.
+
+Запуск: python -m benchmarks.bench_yaml [количество ...] (по умолчанию 10000 и 100000)
+"""
+import itertools
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import yaml
+
+from travel_agency import Client_rep_yaml as yaml_module
+from travel_agency.Client import Client
+from travel_agency.Client_rep_yaml import Client_rep_yaml
+
+# Номер замера: репозиторий YAML - общий экземпляр на путь, поэтому каждый замер работает со своими файлами
+_runs = itertools.count()
+
+
+@contextmanager
+def _implementation(loader, dumper):
+    """Временная подмена загрузчика и генератора YAML в модуле репозитория"""
+    saved = yaml_module._SafeLoader, yaml_module._SafeDumper
+    yaml_module._SafeLoader, yaml_module._SafeDumper = loader, dumper
+    try:
+        yield
+    finally:
+        yaml_module._SafeLoader, yaml_module._SafeDumper = saved
+
+
+def _clients(count: int) -> list:
+    return [
+        Client.from_trusted(
+            i,
+            "Иванов",
+            "Иван",
+            "Иванович",
+            "15.05.1990",
+            f"+7 999 {i % 1000:03d}-{i % 100:02d}-{i % 97:02d}",
+            f"4501 {i % 1000000:06d}",
+            f"client{i}@mail.ru",
+            float(i % 10000),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(clients: list, streaming: bool, directory: str) -> tuple:
+    """Время записи и чтения файла (секунды)"""
+    run = next(_runs)
+    file_path = os.path.join(directory, f"clients-{run}.yaml")
+    repo = Client_rep_yaml(file_path, streaming=streaming)
+    repo._clients = list(clients)
+
+    started = time.perf_counter()
+    repo.write_all()
+    write_time = time.perf_counter() - started
+
+    # Чтение по новому пути: открытие прежнего вернуло бы уже загруженный экземпляр repo
+    load_path = os.path.join(directory, f"clients-{run}-load.yaml")
+    os.replace(file_path, load_path)
+    started = time.perf_counter()
+    loaded = Client_rep_yaml(load_path)
+    load_time = time.perf_counter() - started
+    assert loaded is not repo and loaded.get_count() == len(clients)
+    os.remove(load_path)
+    return write_time, load_time
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    implementations = [("Python", yaml.SafeLoader, yaml.SafeDumper)]
+    if yaml.__with_libyaml__:
+        implementations.insert(0, ("libyaml", yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print("libyaml недоступна - замер только для реализации на чистом Python")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for count in counts:
+            clients = _clients(count)
+            print(f"\nКлиентов: {count}")
+            print(f"{'Реализация':<10} {'Формат':<8} {'Запись, с':>10} {'Чтение, с':>10}")
+            for name, loader, dumper in implementations:
+                with _implementation(loader, dumper):
+                    for layout, streaming in (("список", False), ("поток", True)):
+                        write_time, load_time = measure(clients, streaming, directory)
+                        print(f"{name:<10} {layout:<8} {write_time:>10.2f} {load_time:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
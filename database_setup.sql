@@ -18,9 +18,17 @@ CREATE TABLE clients (
 );
 
 -- Создание индексов для оптимизации поиска
-CREATE INDEX idx_clients_surname ON clients(surname);
+-- id в индексе по фамилии нужен для постраничного вывода по курсору (ORDER BY surname, id)
+CREATE INDEX idx_clients_surname ON clients(surname, id);
 CREATE INDEX idx_clients_email ON clients(email);
 CREATE INDEX idx_clients_birth_date ON clients(birth_date);
+-- Индекс для поиска и проверки уникальности по ФИО + дате рождения без учета регистра
+CREATE INDEX idx_clients_identity ON clients(lower(surname), lower(firstname), birth_date);
+-- Индексы для поиска по email без учета регистра, по телефону и паспорту без форматирования
+CREATE INDEX idx_clients_email_lower ON clients(lower(email));
+CREATE INDEX idx_clients_phone_normalized ON clients(right(regexp_replace(phone_number, '\D', '', 'g'), 10));
+-- Паспорт уникален (по цифрам): на этот индекс опирается Client_rep_DB.upsert_clients (ON CONFLICT)
+CREATE UNIQUE INDEX idx_clients_pasport_normalized ON clients(regexp_replace(pasport, '\D', '', 'g'));
 
 -- Наполнение таблицы тестовыми данными
 INSERT INTO clients (surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance) VALUES
@@ -96,7 +96,7 @@ def work_with_db_repository():
         if choice == "1":
             # Просмотр всех записей
             print_section_title("ВСЕ ЗАПИСИ ИЗ БД")
-            clients = repo.read_all()
+            clients = repo.view()
             if not clients:
                 print("\nБД пуста")
             else:
@@ -387,7 +387,7 @@ def work_with_decorated_repository():
         elif choice == "5":
             # Просмотр с фильтрами
             print_section_title("ДАННЫЕ С ПРИМЕНЕНИЕМ ФИЛЬТРОВ И СОРТИРОВКИ")
-            clients = decorated_repo.read_all()
+            clients = decorated_repo.view()
 
             if not clients:
                 print("\nНет данных, соответствующих фильтрам")
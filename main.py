@@ -2,6 +2,7 @@ import json
 
 from travel_agency.BaseClient import BaseClient
 from travel_agency.Client import Client
+from travel_agency.ClientIdentityIndex import IndexedClientList
 from travel_agency.Client_rep_json import Client_rep_json
 from travel_agency.Client_rep_yaml import Client_rep_yaml
 from travel_agency.Client_rep_DB_adapter import Client_rep_DB_adapter
@@ -81,20 +82,15 @@ def print_client_full(client):
 
 
 def is_client_unique(client, all_clients):
-    return not any(existing_client == client for existing_client in all_clients)
+    # Для IndexedClientList проверка выполняется по хэш-индексу за O(1)
+    return client not in all_clients
 
 
 def is_email_unique(email, all_clients):
     if not email or email.lower() in ["не указан", "none"]:
         return True
-    client_count = 0
-    for existing_client in all_clients:
-        if isinstance(existing_client, Client) and existing_client.get_email():
-            if existing_client.get_email().lower() == email.lower():
-                client_count += 1
-                if client_count >= 1:
-                    return False
-    return True
+    # Поиск по хэш-индексу email из IndexedClientList
+    return all_clients.email_index.first(Client.normalize_email(email)) is None
 
 
 def delete_client_by_fio_and_birth_date(all_clients):
@@ -113,44 +109,16 @@ def delete_client_by_fio_and_birth_date(all_clients):
 
         birth_date = datetime.strptime(birth_date_str, "%d.%m.%Y").date()
 
-        # Нормализация введенных данных
-        surname_norm = surname.lower().strip()
-        firstname_norm = firstname.lower().strip()
-        fathers_name_norm = fathers_name.lower().strip() if fathers_name else None
-        if fathers_name_norm in ["", "не указано", "none"]:
-            fathers_name_norm = None
-
-        for i, client in enumerate(all_clients):
-            # Нормализация данных клиента
-            client_surname = client.get_surname().lower().strip()
-            client_firstname = client.get_firstname().lower().strip()
-            client_fathers_name = client.get_fathers_name()
-            if client_fathers_name:
-                client_fathers_name = client_fathers_name.lower().strip()
-            else:
-                client_fathers_name = None
-
-            # Сравнение всех полей
-            surname_match = client_surname == surname_norm
-            firstname_match = client_firstname == firstname_norm
-
-            # Гибкое сравнение отчества (оба None или оба равны)
-            fathers_name_match = False
-            if client_fathers_name is None and fathers_name_norm is None:
-                fathers_name_match = True
-            elif client_fathers_name is not None and fathers_name_norm is not None:
-                fathers_name_match = client_fathers_name == fathers_name_norm
-            elif client_fathers_name == "" and fathers_name_norm is None:
-                fathers_name_match = True
-            elif client_fathers_name is None and fathers_name_norm == "":
-                fathers_name_match = True
-
-            birth_date_match = client.get_birth_date() == birth_date
-
-            if surname_match and firstname_match and fathers_name_match and birth_date_match:
-                deleted_client = all_clients.pop(i)
-                print_success(f"Клиент {deleted_client.get_surname()} {deleted_client.get_firstname()} удален!")
-                return True
+        if fathers_name.lower() in ["не указано", "none"]:
+            fathers_name = None
+
+        # Поиск по нормализованному ключу ФИО + дата рождения
+        matches = all_clients.identity_index.find(surname, firstname, fathers_name, birth_date)
+        if matches:
+            deleted_client = matches[0]
+            all_clients.remove(deleted_client)
+            print_success(f"Клиент {deleted_client.get_surname()} {deleted_client.get_firstname()} удален!")
+            return True
 
         print_error("Клиент с указанными ФИО и датой рождения не найден.")
         return False
@@ -266,7 +234,7 @@ def get_repository_menu_choice():
 def work_with_repository():
     print_section_title("РАБОТА С JSON РЕПОЗИТОРИЕМ")
 
-    repo = Client_rep_json("clients_data.json")
+    repo = Client_rep_json("clients_data.json", snapshot=True)
 
     while True:
         choice = get_repository_menu_choice()
@@ -275,7 +243,7 @@ def work_with_repository():
             # Просмотр всех записей
             print_section_title("ВСЕ ЗАПИСИ ИЗ РЕПОЗИТОРИЯ")
             repo.reload_from_file()
-            clients = repo.read_all()
+            clients = repo.view()
             if not clients:
                 print("\nРепозиторий пуст")
             else:
@@ -335,7 +303,7 @@ def work_with_repository():
                 continue
 
             print("\nОтсортированный список:")
-            for client in repo.read_all():
+            for client in repo.iter_all():
                 print(f"Email: {client.get_email() or 'Не указан'} - {client.get_surname()} {client.get_firstname()}")
 
         elif choice == "5":
@@ -487,7 +455,7 @@ def get_yaml_repository_menu_choice():
 def work_with_yaml_repository():
     print_section_title("РАБОТА С YAML РЕПОЗИТОРИЕМ")
 
-    repo = Client_rep_yaml("clients_data.yaml")
+    repo = Client_rep_yaml("clients_data.yaml", snapshot=True)
 
     while True:
         choice = get_yaml_repository_menu_choice()
@@ -496,7 +464,7 @@ def work_with_yaml_repository():
             # Просмотр всех записей
             print_section_title("ВСЕ ЗАПИСИ ИЗ YAML РЕПОЗИТОРИЯ")
             repo.reload_from_file()
-            clients = repo.read_all()
+            clients = repo.view()
             if not clients:
                 print("\nРепозиторий пуст")
             else:
@@ -556,7 +524,7 @@ def work_with_yaml_repository():
                 continue
 
             print("\nОтсортированный список:")
-            for client in repo.read_all():
+            for client in repo.iter_all():
                 print(f"{client.get_surname()} {client.get_firstname()} - Email: {client.get_email() or 'Не указан'}")
 
         elif choice == "5":
@@ -1016,7 +984,7 @@ def work_with_db_repository():
 
         if choice == "1":
             print_section_title("ВСЕ ЗАПИСИ ИЗ БД")
-            clients = repo.read_all()
+            clients = repo.view()
             if not clients:
                 print("\nБД пуста")
             else:
@@ -1206,10 +1174,10 @@ def work_with_decorated_repository():
     repo_choice = input("\nВаш выбор (1-3): ").strip()
 
     if repo_choice == "1":
-        base_repo = Client_rep_json("clients_data.json")
+        base_repo = Client_rep_json("clients_data.json", snapshot=True)
         repo_name = "JSON"
     elif repo_choice == "2":
-        base_repo = Client_rep_yaml("clients_data.yaml")
+        base_repo = Client_rep_yaml("clients_data.yaml", snapshot=True)
         repo_name = "YAML"
     elif repo_choice == "3":
         base_repo = Client_rep_DB_adapter()
@@ -1288,7 +1256,7 @@ def work_with_decorated_repository():
 
         elif choice == "5":
             print_section_title("ДАННЫЕ С ПРИМЕНЕНИЕМ ФИЛЬТРОВ И СОРТИРОВКИ")
-            clients = decorated_repo.read_all()
+            clients = decorated_repo.view()
 
             if not clients:
                 print("\nНет данных, соответствующих фильтрам")
@@ -1353,7 +1321,7 @@ def main():
     print_section_title("ПРОГРАММА ДЛЯ ТЕСТИРОВАНИЯ КЛАССОВ ТУРИСТИЧЕСКОЙ КОМПАНИИ")
     print("\nВведите '0' в любое поле для завершения ввода")
 
-    all_clients = []
+    all_clients = IndexedClientList()
 
     while True:
         choice = get_main_menu_choice()
@@ -0,0 +1,50 @@
+"""
+Проверка поиска по индексам Client_rep_binary после удаления и замены клиентов
+"""
+from datetime import date
+
+from travel_agency.Client import Client
+from travel_agency.Client_rep_binary import Client_rep_binary
+
+
+def make_client(surname, email, phone_number, pasport):
+    return Client(surname=surname, firstname="Иван", fathers_name="Иванович", birth_date="15.05.1990",
+                  phone_number=phone_number, pasport=pasport, email=email, balance=1000.0)
+
+
+def make_repo(tmp_path):
+    repo = Client_rep_binary(str(tmp_path / "clients.bin"))
+    repo.add_client(make_client("Иванов", "ivanov@mail.ru", "+79991234567", "1234 567890"))
+    repo.add_client(make_client("Петров", "petrov@mail.ru", "+79997654321", "4321 098765"))
+    return repo
+
+
+def test_find_after_delete(tmp_path):
+    repo = make_repo(tmp_path)
+    # Индексы строятся до удаления
+    assert repo.find_by_email("ivanov@mail.ru").get_id() == 1
+    assert repo.find_by_phone("+79991234567").get_id() == 1
+    assert repo.find_by_passport("1234 567890").get_id() == 1
+    assert len(repo.find_by_identity("Иванов", "Иван", "Иванович", date(1990, 5, 15))) == 1
+
+    assert repo.delete_by_id(1)
+
+    assert repo.find_by_email("ivanov@mail.ru") is None
+    assert repo.find_by_phone("+79991234567") is None
+    assert repo.find_by_passport("1234 567890") is None
+    assert repo.find_by_identity("Иванов", "Иван", "Иванович", date(1990, 5, 15)) == []
+    assert repo.find_by_email("petrov@mail.ru").get_id() == 2
+
+
+def test_find_after_replace(tmp_path):
+    repo = make_repo(tmp_path)
+    assert repo.find_by_email("petrov@mail.ru").get_id() == 2
+
+    assert repo.replace_by_id(2, make_client("Сидоров", "sidorov@mail.ru", "+79990000000", "1111 222222"))
+
+    assert repo.find_by_email("petrov@mail.ru") is None
+    assert repo.find_by_phone("+79997654321") is None
+    assert repo.find_by_passport("4321 098765") is None
+    assert repo.find_by_identity("Петров", "Иван", "Иванович", date(1990, 5, 15)) == []
+    found = repo.find_by_email("sidorov@mail.ru")
+    assert found.get_id() == 2 and found.get_surname() == "Сидоров"
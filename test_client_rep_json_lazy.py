@@ -0,0 +1,49 @@
+"""
+Проверка поиска по индексам Client_rep_json_lazy: актуальность после изменений
+и ограниченный объем клиентов в памяти
+"""
+import json
+
+from travel_agency.BaseClient import BaseClient
+from travel_agency.Client import Client
+from travel_agency.Client_rep_json_lazy import Client_rep_json_lazy
+
+
+def make_repo(tmp_path, count=50, cache_size=5):
+    records = [
+        {"id": i, "surname": "Иванов", "firstname": "Иван", "fathers_name": None, "birth_date": "15.05.1990",
+         "phone_number": f"+7999{i:07d}", "pasport": f"1234 {i:06d}", "email": f"client{i}@mail.ru",
+         "balance": 100.0}
+        for i in range(1, count + 1)
+    ]
+    file_path = tmp_path / "clients.json"
+    file_path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
+    return Client_rep_json_lazy(str(file_path), cache_size=cache_size)
+
+
+def test_find_after_delete_and_replace(tmp_path):
+    repo = make_repo(tmp_path)
+    assert repo.find_by_email("client3@mail.ru").get_id() == 3
+    assert repo.find_by_phone("+79990000004").get_id() == 4
+
+    assert repo.delete_by_id(3)
+    assert repo.replace_by_id(4, Client(surname="Петров", firstname="Петр", birth_date="01.01.1980",
+                                        phone_number="+79990000000", pasport="4321 000000",
+                                        email="petrov@mail.ru"))
+
+    assert repo.find_by_email("client3@mail.ru") is None
+    assert repo.find_by_passport("1234 000003") is None
+    assert repo.find_by_phone("+79990000004") is None
+    assert repo.find_by_email("petrov@mail.ru").get_surname() == "Петров"
+
+
+def test_index_does_not_hold_clients(tmp_path):
+    repo = make_repo(tmp_path, count=200, cache_size=5)
+    assert repo.find_by_email("client150@mail.ru").get_id() == 150
+    repo.find_by_identity("Иванов", "Иван")
+
+    # Индексы хранят ID, а в памяти остается не больше cache_size загруженных клиентов
+    for index in repo._indexes.values():
+        for bucket in index._clients_by_key.values():
+            assert not any(isinstance(entry, BaseClient) for entry in bucket)
+    assert len(repo._clients._cache) <= 5
@@ -0,0 +1,26 @@
+"""
+Проверка перезагрузки Client_rep_yaml для файла с записями без ID
+"""
+import yaml
+
+from travel_agency.Client_rep_yaml import Client_rep_yaml
+
+
+def test_reload_items_without_id(tmp_path):
+    file_path = tmp_path / "clients.yaml"
+    items = [
+        {"surname": "Иванов", "firstname": "Иван", "birth_date": "15.05.1990"},
+        {"surname": "Петров", "firstname": "Петр", "birth_date": "1.2.1985", "id": 7},
+    ]
+    file_path.write_text(yaml.safe_dump(items, allow_unicode=True), encoding="utf-8")
+    repo = Client_rep_yaml(str(file_path))
+    assert repo.get_count() == 2
+
+    diff = repo.reload_from_file(force=True)
+
+    # Полная перезагрузка: ни одного ID None, клиент без ID в файле получает ID заново
+    assert None not in diff.added and None not in diff.changed
+    assert 7 in diff.changed
+    assert repo.get_count() == 2
+    assert all(client.get_id() is not None for client in repo.read_all())
+    assert repo.get_by_id(7).get_surname() == "Петров"
@@ -1,10 +1,17 @@
 import json
 import re
 import uuid
-from datetime import datetime
+from datetime import date, datetime
+
+# Шаблоны компилируются один раз при импорте, а не при каждой проверке
+_DIGIT_PATTERN = re.compile(r"\d")
+_BIRTH_DATE_PATTERN = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
 
 
 class BaseClient:
+    # Компактное представление без __dict__ (важно при сотнях тысяч клиентов в памяти)
+    __slots__ = ("_id", "_surname", "_firstname", "_fathers_name", "_birth_date")
+
     def __init__(self, *args, **kwargs):
         if args and len(args) >= 4:
             surname, firstname, fathers_name, birth_date = args[0], args[1], args[2], args[3]
@@ -54,44 +61,129 @@ class BaseClient:
     def get_birth_date(self):
         return self._birth_date
 
+    @staticmethod
+    def _id_error(id):
+        if (isinstance(id, int) and id > 0) or (isinstance(id, str) and len(id) == 16):
+            return None
+        return "Неверный ID. Должен быть положительным int или UUID строкой"
+
     @staticmethod
     def _validate_id(id):
-        if isinstance(id, int) and id > 0:
-            return id
-        elif isinstance(id, str) and len(id) == 16:
-            return id
-        else:
-            raise ValueError("Неверный ID. Должен быть положительным int или UUID строкой")
+        error = BaseClient._id_error(id)
+        if error:
+            raise ValueError(error)
+        return id
 
     @classmethod
     def _generate_id(cls):
         return uuid.uuid4().hex[:16]
 
     @staticmethod
-    def _validate_fio(fio_field, is_fathers_name=False):
-        if not isinstance(fio_field, str) and not is_fathers_name:
-            raise ValueError("Имя и фамилия должны быть строковыми")
+    def _fio_error(fio_field, is_fathers_name=False):
+        if is_fathers_name and fio_field is None:
+            return None
+        if not isinstance(fio_field, str):
+            return "ФИО должно быть строковым" if is_fathers_name else "Имя и фамилия должны быть строковыми"
         if not fio_field and not is_fathers_name:
-            raise ValueError("ФИО не должно быть пустым")
-        if ((is_fathers_name and fio_field is not None) or not is_fathers_name) and re.search(
-            r"\d", fio_field
-        ) is not None:
-            raise ValueError("ФИО не должно содержать цифр")
+            return "ФИО не должно быть пустым"
+        if _DIGIT_PATTERN.search(fio_field) is not None:
+            return "ФИО не должно содержать цифр"
+        return None
+
+    @staticmethod
+    def _validate_fio(fio_field, is_fathers_name=False):
+        error = BaseClient._fio_error(fio_field, is_fathers_name)
+        if error:
+            raise ValueError(error)
         return fio_field
 
     @staticmethod
-    def _validate_birth_date(birth_date):
+    def _parse_birth_date(birth_date):
+        """
+        Разбор даты рождения без исключений.
+
+        Returns:
+            Пара (дата или None, текст ошибки или None)
+        """
         if birth_date is None:
-            return None
+            return None, None
         if isinstance(birth_date, str):
-            try:
-                return datetime.strptime(birth_date, "%d.%m.%Y").date()
-            except ValueError:
-                raise ValueError("Неверный формат даты. Используйте ДД.ММ.ГГГГ")
+            match = _BIRTH_DATE_PATTERN.fullmatch(birth_date)
+            if match:
+                try:
+                    return date(int(match.group(3)), int(match.group(2)), int(match.group(1))), None
+                except ValueError:
+                    pass
+            return None, "Неверный формат даты. Используйте ДД.ММ.ГГГГ"
         elif isinstance(birth_date, datetime):
-            return birth_date.date()
+            return birth_date.date(), None
         else:
-            raise ValueError("Дата рождения должна быть строкой в формате ДД.ММ.ГГГГ или datetime объектом")
+            return None, "Дата рождения должна быть строкой в формате ДД.ММ.ГГГГ или datetime объектом"
+
+    @staticmethod
+    def _validate_birth_date(birth_date):
+        value, error = BaseClient._parse_birth_date(birth_date)
+        if error:
+            raise ValueError(error)
+        return value
+
+    @staticmethod
+    def _trusted_birth_date(birth_date):
+        """Приведение даты из доверенного источника без strptime (date, datetime или ДД.ММ.ГГГГ)"""
+        if birth_date is None or type(birth_date) is date:
+            return birth_date
+        if isinstance(birth_date, datetime):
+            return birth_date.date()
+        if isinstance(birth_date, date):
+            return birth_date
+        try:
+            day, month, year = birth_date.split(".")
+            return date(int(year), int(month), int(day))
+        except (AttributeError, ValueError):
+            # Нестандартное значение - полная проверка с понятным сообщением об ошибке
+            return BaseClient._validate_birth_date(birth_date)
+
+    @classmethod
+    def from_trusted(cls, id=None, surname=None, firstname=None, fathers_name=None, birth_date=None):
+        """
+        Быстрое создание объекта из уже проверенных данных (своя БД, свои файлы)
+        без повторной валидации полей.
+
+        Args:
+            id: ID клиента (если None, генерируется, как в конструкторе)
+            surname: Фамилия
+            firstname: Имя
+            fathers_name: Отчество
+            birth_date: Дата рождения (date, datetime или строка ДД.ММ.ГГГГ)
+
+        Returns:
+            Новый объект класса
+        """
+        if surname is None or firstname is None:
+            # Обязательные поля отсутствуют - та же ошибка, что и в конструкторе
+            cls._validate_fio(surname)
+            cls._validate_fio(firstname)
+        client = cls.__new__(cls)
+        client._id = cls._generate_id() if id is None else id
+        client._surname = surname
+        client._firstname = firstname
+        client._fathers_name = fathers_name
+        client._birth_date = cls._trusted_birth_date(birth_date)
+        return client
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Быстрое создание объекта из кортежа в порядке full_information
+        (id, surname, firstname, fathers_name, birth_date, ...) без валидации.
+
+        Args:
+            row: Кортеж или строка результата запроса к БД
+
+        Returns:
+            Новый объект класса
+        """
+        return cls.from_trusted(*row)
 
     @classmethod
     def from_json(cls, json_str):
@@ -119,15 +211,44 @@ class BaseClient:
         except (ValueError, IndexError) as e:
             raise ValueError(f"Ошибка парсинга строки: {e}")
 
+    @staticmethod
+    def _normalize_fio(value):
+        """Нормализация части ФИО для сравнения: без пробелов по краям, в нижнем регистре, пустое -> None"""
+        if value is None:
+            return None
+        return value.strip().lower() or None
+
+    @staticmethod
+    def make_identity_key(surname, firstname, fathers_name=None, birth_date=None):
+        """
+        Нормализованный ключ личности клиента (ФИО + дата рождения).
+
+        Args:
+            surname: Фамилия
+            firstname: Имя
+            fathers_name: Отчество
+            birth_date: Дата рождения (date)
+
+        Returns:
+            Кортеж, пригодный для словарей и множеств
+        """
+        normalize = BaseClient._normalize_fio
+        return normalize(surname), normalize(firstname), normalize(fathers_name), birth_date
+
+    @property
+    def identity_key(self):
+        """Ключ личности клиента, согласованный с __eq__ и __hash__"""
+        return self.make_identity_key(self._surname, self._firstname, self._fathers_name, self._birth_date)
+
     def __eq__(self, other):
         if not isinstance(other, BaseClient):
             return False
-        return (
-            self.get_surname().lower() == other.get_surname().lower()
-            and self.get_firstname().lower() == other.get_firstname().lower()
-            and self.get_fathers_name() == other.get_fathers_name()
-            and self.get_birth_date() == other.get_birth_date()
-        )
+        return self.identity_key == other.identity_key
+
+    def __hash__(self):
+        # Хэш зависит от ФИО и даты рождения: после изменения этих полей через set_*
+        # объект нужно заново добавить в множества и индексы
+        return hash(self.identity_key)
 
     def __str__(self):
         birth_info = f", {self.get_birth_date().strftime('%d.%m.%Y')}" if self.get_birth_date() else ""
@@ -1,10 +1,18 @@
 import json
 import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from travel_agency.BaseClient import BaseClient
 
+_PHONE_PATTERN = re.compile(r"((8|\+7)[\- ]?)?(\(?\d{3}\)?[\- ]?)?[\d\- ]{7,10}")
+_PASPORT_PATTERN = re.compile(r"\d{4} \d{6}")
+_NON_DIGIT_PATTERN = re.compile(r"\D")
+_EMAIL_PATTERN = re.compile(r"([a-zA-Z0-9._-]+@[a-zA-Z0-9._-]+\.[a-zA-Z0-9_-]+)")
+
 
 class Client(BaseClient):
+    __slots__ = ("_phone_number", "_pasport", "_email", "_balance")
+
     def __init__(self, *args, **kwargs):
         phone_number = kwargs.pop("phone_number", None)
         pasport = kwargs.pop("pasport", None)
@@ -43,79 +51,268 @@ class Client(BaseClient):
         return self._balance
 
     @staticmethod
-    def _validate_phone_number(phone_number):
+    def normalize_email(email):
+        """Нормализованный email для поиска и проверки уникальности (нижний регистр)"""
+        if not email:
+            return None
+        return email.strip().lower() or None
+
+    @staticmethod
+    def normalize_phone(phone_number):
+        """Нормализованный телефон: последние 10 цифр (+7 999 ... и 8 (999) ... совпадают)"""
+        if not phone_number:
+            return None
+        digits = _NON_DIGIT_PATTERN.sub("", phone_number)
+        return digits[-10:] or None
+
+    @staticmethod
+    def normalize_pasport(pasport):
+        """Нормализованный паспорт: только цифры"""
+        if not pasport:
+            return None
+        return _NON_DIGIT_PATTERN.sub("", pasport) or None
+
+    @staticmethod
+    def _phone_number_error(phone_number):
         if phone_number is None:
             return None
-        if not isinstance(phone_number, str) or not re.fullmatch(
-            r"((8|\+7)[\- ]?)?(\(?\d{3}\)?[\- ]?)?[\d\- ]{7,10}", phone_number
-        ):
-            raise ValueError("Неверный номер телефона")
-        return phone_number
+        if not isinstance(phone_number, str) or not _PHONE_PATTERN.fullmatch(phone_number):
+            return "Неверный номер телефона"
+        return None
 
     @staticmethod
-    def _validate_pasport(pasport):
+    def _pasport_error(pasport):
         if pasport is None:
             return None
-        if not isinstance(pasport, str) or not re.fullmatch(r"\d{4} \d{6}", pasport):
-            raise ValueError("Неверные паспортные данные. Формат: XXXX XXXXXX")
-        return pasport
+        if not isinstance(pasport, str) or not _PASPORT_PATTERN.fullmatch(pasport):
+            return "Неверные паспортные данные. Формат: XXXX XXXXXX"
+        return None
 
     @staticmethod
-    def _validate_email(email):
+    def _email_error(email):
         if email is None:
             return None
-        if not isinstance(email, str) or not re.fullmatch(r"([a-zA-Z0-9._-]+@[a-zA-Z0-9._-]+\.[a-zA-Z0-9_-]+)", email):
-            raise ValueError("Неверный email")
-        return email
+        if not isinstance(email, str) or not _EMAIL_PATTERN.fullmatch(email):
+            return "Неверный email"
+        return None
 
     @staticmethod
-    def _validate_balance(balance):
+    def _balance_error(balance):
         if balance is not None:
             if not isinstance(balance, (float, int)):
-                raise ValueError("Баланс должен быть числом")
+                return "Баланс должен быть числом"
             if balance < 0:
-                raise ValueError("Баланс не должен быть отрицательным")
+                return "Баланс не должен быть отрицательным"
+        return None
+
+    @staticmethod
+    def _validate_phone_number(phone_number):
+        error = Client._phone_number_error(phone_number)
+        if error:
+            raise ValueError(error)
+        return phone_number
+
+    @staticmethod
+    def _validate_pasport(pasport):
+        error = Client._pasport_error(pasport)
+        if error:
+            raise ValueError(error)
+        return pasport
+
+    @staticmethod
+    def _validate_email(email):
+        error = Client._email_error(email)
+        if error:
+            raise ValueError(error)
+        return email
+
+    @staticmethod
+    def _validate_balance(balance):
+        error = Client._balance_error(balance)
+        if error:
+            raise ValueError(error)
         return balance
 
+    @classmethod
+    def validate_many(
+        cls,
+        rows: Optional[Iterable[Dict[str, Any]]] = None,
+        columns: Optional[Dict[str, Sequence[Any]]] = None,
+    ) -> Tuple[List["Client"], List[Dict[str, Any]]]:
+        """
+        Пакетная проверка данных клиентов за один проход без исключений на каждую ошибку.
+        Применяет те же правила, что и конструктор Client, но не останавливается на первой
+        ошибке, а собирает отчет по всем строкам.
+
+        Args:
+            rows: Итерируемый набор словарей с полями клиента (как для Client(**row))
+            columns: Альтернатива rows - словарь "поле -> последовательность значений"
+
+        Returns:
+            Пара (список корректных объектов Client,
+            список ошибок вида {"row": номер строки, "field": поле, "error": текст})
+        """
+        if columns is not None:
+            names = list(columns)
+            rows = (dict(zip(names, values)) for values in zip(*columns.values()))
+
+        valid: List[Client] = []
+        errors: List[Dict[str, Any]] = []
+        fio_error = cls._fio_error
+        parse_birth_date = cls._parse_birth_date
+        field_checks = (
+            ("phone_number", cls._phone_number_error),
+            ("pasport", cls._pasport_error),
+            ("email", cls._email_error),
+            ("balance", cls._balance_error),
+        )
+
+        for row_number, row in enumerate(rows or ()):
+            row_errors = []
+
+            client_id = row.get("id")
+            if client_id is None:
+                client_id = cls._generate_id()
+            else:
+                error = cls._id_error(client_id)
+                if error:
+                    row_errors.append(("id", error))
+
+            for field, is_fathers_name in (("surname", False), ("firstname", False), ("fathers_name", True)):
+                error = fio_error(row.get(field), is_fathers_name)
+                if error:
+                    row_errors.append((field, error))
+
+            birth_date, error = parse_birth_date(row.get("birth_date"))
+            if error:
+                row_errors.append(("birth_date", error))
+
+            for field, check in field_checks:
+                error = check(row.get(field))
+                if error:
+                    row_errors.append((field, error))
+
+            if row_errors:
+                errors.extend({"row": row_number, "field": field, "error": error} for field, error in row_errors)
+                continue
+
+            valid.append(
+                cls.from_trusted(
+                    client_id,
+                    row["surname"],
+                    row["firstname"],
+                    row.get("fathers_name"),
+                    birth_date,
+                    row.get("phone_number"),
+                    row.get("pasport"),
+                    row.get("email"),
+                    row.get("balance"),
+                )
+            )
+
+        return valid, errors
+
+    @classmethod
+    def from_trusted(
+        cls,
+        id=None,
+        surname=None,
+        firstname=None,
+        fathers_name=None,
+        birth_date=None,
+        phone_number=None,
+        pasport=None,
+        email=None,
+        balance=None,
+    ):
+        """
+        Быстрое создание клиента из уже проверенных данных без регулярных выражений
+        и разбора даты через strptime. Используется репозиториями при загрузке.
+
+        Returns:
+            Новый объект Client
+        """
+        client = super().from_trusted(id, surname, firstname, fathers_name, birth_date)
+        client._phone_number = phone_number
+        client._pasport = pasport
+        client._email = email
+        client._balance = balance
+        return client
+
+    @classmethod
+    def from_row(cls, row):
+        """
+        Быстрое создание клиента из строки БД
+        (id, surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance).
+
+        Args:
+            row: Кортеж с данными из БД (balance может быть Decimal)
+
+        Returns:
+            Новый объект Client
+        """
+        balance = row[8]
+        return cls.from_trusted(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            row[4],
+            row[5],
+            row[6],
+            row[7],
+            float(balance) if balance is not None else None,
+        )
+
     @classmethod
     def from_json(cls, json_str):
         fields = json.loads(json_str)
         return cls(**fields)
 
+    @staticmethod
+    def _string_to_fields(string_data, delimiter=","):
+        """
+        Разбор строки с разделителями в словарь полей (без проверки значений).
+
+        Returns:
+            Словарь аргументов для конструктора Client
+        """
+        fields = string_data.split(delimiter)
+        if not (8 <= len(fields) <= 9):
+            raise ValueError(f"Ожидалось 8-9 полей, получено {len(fields)}")
+
+        field_names = [
+            "surname",
+            "firstname",
+            "fathers_name",
+            "birth_date",
+            "phone_number",
+            "pasport",
+            "email",
+            "balance",
+            "id",
+        ]
+        kwargs = {}
+
+        for i, value in enumerate(fields):
+            if i < len(field_names):
+                field_name = field_names[i]
+                value = value.strip() if value else None
+                if value and value.lower() != "none":
+                    if field_name == "balance":
+                        try:
+                            kwargs[field_name] = float(value)
+                        except ValueError:
+                            raise ValueError(f"Неверный формат баланса: {value}")
+                    else:
+                        kwargs[field_name] = value
+
+        return kwargs
+
     @classmethod
     def from_string(cls, string_data, delimiter=","):
         try:
-            fields = string_data.split(delimiter)
-            if not (8 <= len(fields) <= 9):
-                raise ValueError(f"Ожидалось 8-9 полей, получено {len(fields)}")
-
-            field_names = [
-                "surname",
-                "firstname",
-                "fathers_name",
-                "birth_date",
-                "phone_number",
-                "pasport",
-                "email",
-                "balance",
-                "id",
-            ]
-            kwargs = {}
-
-            for i, value in enumerate(fields):
-                if i < len(field_names):
-                    field_name = field_names[i]
-                    value = value.strip() if value else None
-                    if value and value.lower() != "none":
-                        if field_name == "balance":
-                            try:
-                                kwargs[field_name] = float(value)
-                            except ValueError:
-                                raise ValueError(f"Неверный формат баланса: {value}")
-                        else:
-                            kwargs[field_name] = value
-
-            return cls(**kwargs)
+            return cls(**cls._string_to_fields(string_data, delimiter))
         except (ValueError, IndexError) as e:
             raise ValueError(f"Ошибка парсинга строки: {e}")
 
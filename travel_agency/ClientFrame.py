@@ -0,0 +1,128 @@
+from datetime import date
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from travel_agency.Client import Client
+
+
+class StringColumn:
+    """
+    Строковая колонка с интернированием: каждое уникальное значение хранится один раз,
+    а для строк хранится массив кодов int32.
+    """
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        vocabulary = {}
+        codes = [vocabulary.setdefault(value, len(vocabulary)) for value in values]
+        self.categories: List[Optional[str]] = list(vocabulary)
+        self.codes = np.array(codes, dtype=np.int32)
+        self._sort_keys: Optional[np.ndarray] = None
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        return self.categories[self.codes[i]]
+
+    def category_mask(self, predicate) -> np.ndarray:
+        """Проверка условия один раз для каждого уникального значения и разворачивание маски на все строки"""
+        return np.array([bool(predicate(value)) for value in self.categories], dtype=bool)[self.codes]
+
+    def sort_keys(self) -> np.ndarray:
+        """Ранги строк для сортировки (None считается пустой строкой, как в ClientSorter)"""
+        if self._sort_keys is not None:
+            return self._sort_keys
+        order = sorted(range(len(self.categories)), key=lambda code: self.categories[code] or "")
+        ranks = np.empty(len(self.categories), dtype=np.int64)
+        previous = object()
+        rank = -1
+        for code in order:
+            value = self.categories[code] or ""
+            if value != previous:
+                rank += 1
+                previous = value
+            ranks[code] = rank
+        self._sort_keys = ranks[self.codes]
+        return self._sort_keys
+
+
+class ClientFrame:
+    """
+    Колоночное хранилище клиентов в памяти.
+    Баланс хранится в массиве float64, даты рождения - порядковыми номерами (ordinal),
+    для пустых значений ведутся маски. Фильтры и сортировка выполняются векторно,
+    а объекты Client создаются только для выбранных строк.
+    """
+
+    def __init__(self, clients: Sequence[Client]):
+        """
+        Построение колонок по списку клиентов.
+
+        Args:
+            clients: Последовательность объектов Client
+        """
+        self.ids = [client.get_id() for client in clients]
+        self.surname = StringColumn(client.get_surname() for client in clients)
+        self.firstname = StringColumn(client.get_firstname() for client in clients)
+        self.fathers_name = StringColumn(client.get_fathers_name() for client in clients)
+        self.phone_number = StringColumn(client.get_phone_number() for client in clients)
+        self.pasport = StringColumn(client.get_pasport() for client in clients)
+        self.email = StringColumn(client.get_email() for client in clients)
+
+        balances = [client.get_balance() for client in clients]
+        self.balance_null = np.array([balance is None for balance in balances], dtype=bool)
+        self.balance = np.array([balance or 0.0 for balance in balances], dtype=np.float64)
+
+        birth_dates = [client.get_birth_date() for client in clients]
+        self.birth_date_null = np.array([value is None for value in birth_dates], dtype=bool)
+        self.birth_date = np.array([value.toordinal() if value else 0 for value in birth_dates], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def all_rows(self) -> np.ndarray:
+        """Маска, выбирающая все строки"""
+        return np.ones(len(self), dtype=bool)
+
+    def argsort(self, column: str, reverse: bool = False, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Устойчивая сортировка номеров строк по колонке.
+
+        Args:
+            column: Имя колонки ("surname", "email", "balance", ...)
+            reverse: Если True, сортировка в обратном порядке
+            rows: Номера строк для сортировки (по умолчанию все)
+
+        Returns:
+            Массив номеров строк в порядке сортировки
+        """
+        if rows is None:
+            rows = np.arange(len(self))
+        if column == "balance":
+            keys = self.balance
+        elif column == "birth_date":
+            keys = self.birth_date.astype(np.int64)
+        else:
+            keys = getattr(self, column).sort_keys()
+        keys = keys[rows]
+        if reverse:
+            keys = -keys
+        return rows[np.argsort(keys, kind="stable")]
+
+    def client_at(self, i: int) -> Client:
+        """Создание объекта Client для строки i"""
+        birth_date = None if self.birth_date_null[i] else date.fromordinal(int(self.birth_date[i]))
+        balance = None if self.balance_null[i] else float(self.balance[i])
+        return Client.from_trusted(
+            self.ids[i],
+            self.surname[i],
+            self.firstname[i],
+            self.fathers_name[i],
+            birth_date,
+            self.phone_number[i],
+            self.pasport[i],
+            self.email[i],
+            balance,
+        )
+
+    def take(self, rows: Iterable[int]) -> List[Client]:
+        """Создание объектов Client только для указанных строк"""
+        return [self.client_at(int(i)) for i in rows]
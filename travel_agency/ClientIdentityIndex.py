@@ -0,0 +1,182 @@
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from travel_agency.BaseClient import BaseClient
+from travel_agency.Client import Client
+
+
+def email_key(client: BaseClient) -> Optional[str]:
+    """Ключ индекса по email (для клиентов без email - None)"""
+    return Client.normalize_email(client.get_email()) if isinstance(client, Client) else None
+
+
+def phone_key(client: BaseClient) -> Optional[str]:
+    """Ключ индекса по телефону"""
+    return Client.normalize_phone(client.get_phone_number()) if isinstance(client, Client) else None
+
+
+def pasport_key(client: BaseClient) -> Optional[str]:
+    """Ключ индекса по паспорту"""
+    return Client.normalize_pasport(client.get_pasport()) if isinstance(client, Client) else None
+
+
+class ClientKeyIndex:
+    """
+    Хэш-индекс клиентов по ключу, вычисляемому функцией key_func.
+    Клиенты с ключом None (поле не заполнено) в индекс не попадают.
+    Группы клиентов хранятся кортежами и при изменении заменяются целиком,
+    поэтому поиск без блокировки не видит группу в промежуточном состоянии.
+
+    Если задана функция resolve, индекс хранит только ID клиентов, а объекты получает
+    через resolve при поиске (для репозиториев, не держащих всех клиентов в памяти).
+    """
+
+    def __init__(
+        self,
+        key_func: Callable[[BaseClient], Optional[Hashable]],
+        clients: Iterable[BaseClient] = (),
+        resolve: Optional[Callable[[Any], Optional[BaseClient]]] = None,
+    ):
+        """
+        Args:
+            key_func: Функция вычисления нормализованного ключа клиента
+            clients: Клиенты для начального заполнения индекса
+            resolve: Функция получения клиента по ID (None - индекс хранит сами объекты)
+        """
+        self.key_func = key_func
+        self._resolve = resolve
+        groups: Dict[Any, List[Any]] = {}
+        for client in clients:
+            key = key_func(client)
+            if key is not None:
+                groups.setdefault(key, []).append(self._entry(client))
+        self._clients_by_key: Dict[Any, Tuple[Any, ...]] = {key: tuple(group) for key, group in groups.items()}
+
+    def _entry(self, client: BaseClient) -> Any:
+        """Элемент группы: ID клиента (при заданном resolve) или сам клиент"""
+        return client if self._resolve is None else client.get_id()
+
+    def _entry_id(self, entry: Any) -> Any:
+        return entry.get_id() if self._resolve is None else entry
+
+    def _client(self, entry: Any) -> Optional[BaseClient]:
+        return entry if self._resolve is None else self._resolve(entry)
+
+    def add(self, client: BaseClient):
+        """Добавить клиента в индекс"""
+        key = self.key_func(client)
+        if key is not None:
+            self._clients_by_key[key] = self._clients_by_key.get(key, ()) + (self._entry(client),)
+
+    def remove(self, client: BaseClient):
+        """
+        Удалить клиента из индекса.
+        Клиент ищется по ID, а не по объекту: репозитории с записями в файле
+        создают новый объект Client при каждом обращении.
+        """
+        key = self.key_func(client)
+        bucket = self._clients_by_key.get(key)
+        if not bucket:
+            return
+        client_id = client.get_id()
+        for i, existing in enumerate(bucket):
+            if self._entry_id(existing) == client_id:
+                bucket = bucket[:i] + bucket[i + 1 :]
+                break
+        else:
+            return
+        if bucket:
+            self._clients_by_key[key] = bucket
+        else:
+            del self._clients_by_key[key]
+
+    def replace(self, old_client: BaseClient, new_client: BaseClient):
+        """Заменить клиента в индексе"""
+        self.remove(old_client)
+        self.add(new_client)
+
+    def find_key(self, key) -> List[BaseClient]:
+        """Найти клиентов по уже нормализованному ключу"""
+        return [self._client(entry) for entry in self._clients_by_key.get(key, ())]
+
+    def first(self, key) -> Optional[BaseClient]:
+        """Первый клиент с указанным ключом или None"""
+        bucket = self._clients_by_key.get(key)
+        return self._client(bucket[0]) if bucket else None
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._clients_by_key.values())
+
+
+class ClientIdentityIndex(ClientKeyIndex):
+    """
+    Хэш-индекс клиентов по нормализованному ключу личности (ФИО + дата рождения).
+    Позволяет проверять уникальность и искать клиента за O(1) вместо перебора списка.
+    """
+
+    def __init__(
+        self,
+        clients: Iterable[BaseClient] = (),
+        resolve: Optional[Callable[[Any], Optional[BaseClient]]] = None,
+    ):
+        """
+        Args:
+            clients: Клиенты для начального заполнения индекса
+            resolve: Функция получения клиента по ID (None - индекс хранит сами объекты)
+        """
+        super().__init__(lambda client: client.identity_key, clients, resolve)
+
+    def find(self, surname, firstname, fathers_name=None, birth_date=None) -> List[BaseClient]:
+        """
+        Найти клиентов по ФИО и дате рождения.
+
+        Returns:
+            Список найденных клиентов (обычно из одного элемента)
+        """
+        return self.find_key(BaseClient.make_identity_key(surname, firstname, fathers_name, birth_date))
+
+    def find_client(self, client: BaseClient) -> Optional[BaseClient]:
+        """Найти уже проиндексированного клиента с той же личностью"""
+        return self.first(client.identity_key)
+
+    def __contains__(self, client: BaseClient) -> bool:
+        return client.identity_key in self._clients_by_key
+
+
+class IndexedClientList(list):
+    """
+    Список клиентов с поддерживаемыми индексами личности и email.
+    Проверка "client in clients" выполняется за O(1) по индексу.
+    Изменять список следует через append, extend, pop и remove.
+    """
+
+    def __init__(self, clients: Iterable[BaseClient] = ()):
+        super().__init__(clients)
+        self.identity_index = ClientIdentityIndex(self)
+        self.email_index = ClientKeyIndex(email_key, self)
+
+    def append(self, client: BaseClient):
+        super().append(client)
+        self.identity_index.add(client)
+        self.email_index.add(client)
+
+    def extend(self, clients: Iterable[BaseClient]):
+        for client in clients:
+            self.append(client)
+
+    def pop(self, index: int = -1) -> BaseClient:
+        client = super().pop(index)
+        self.identity_index.remove(client)
+        self.email_index.remove(client)
+        return client
+
+    def remove(self, client: BaseClient):
+        for i, existing in enumerate(self):
+            if existing is client:
+                self.pop(i)
+                return
+        raise ValueError("Клиент не найден в списке")
+
+    def __contains__(self, client) -> bool:
+        if not isinstance(client, BaseClient):
+            return False
+        return client in self.identity_index
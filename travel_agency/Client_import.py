@@ -0,0 +1,204 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from travel_agency.Client import Client
+
+
+class ImportStats:
+    """Статистика потокового импорта (передается в функцию progress после каждого пакета)"""
+
+    def __init__(self, max_errors: int):
+        self.rows_read = 0
+        self.imported = 0
+        # Корректные клиенты, которые не удалось записать в репозиторий
+        self.failed = 0
+        self.error_count = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.max_errors = max_errors
+        self.started_at = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        """Время с начала импорта в секундах"""
+        return time.perf_counter() - self.started_at
+
+    @property
+    def rows_per_second(self) -> float:
+        """Пропускная способность по прочитанным строкам"""
+        elapsed = self.elapsed
+        return self.rows_read / elapsed if elapsed > 0 else 0.0
+
+    def add_errors(self, errors: List[Dict[str, Any]]):
+        """Учет ошибок; в памяти хранятся только первые max_errors"""
+        self.error_count += len(errors)
+        free = self.max_errors - len(self.errors)
+        if free > 0:
+            self.errors.extend(errors[:free])
+
+    def __str__(self):
+        return (
+            f"Прочитано: {self.rows_read}, импортировано: {self.imported}, не записано: {self.failed}, "
+            f"ошибок: {self.error_count}, "
+            f"{self.rows_per_second:.0f} строк/с"
+        )
+
+
+def _parse_chunk(lines: List[Tuple[int, str]], delimiter: str) -> Tuple[List[Client], List[Dict[str, Any]]]:
+    """
+    Разбор и проверка пакета строк (выполняется в процессе-обработчике).
+
+    Args:
+        lines: Пары (номер строки в файле, текст строки)
+        delimiter: Разделитель полей
+
+    Returns:
+        Пара (корректные клиенты, ошибки вида {"line": номер, "field": поле, "error": текст})
+    """
+    rows = []
+    line_numbers = []
+    errors = []
+    for line_number, line in lines:
+        try:
+            rows.append(Client._string_to_fields(line, delimiter))
+            line_numbers.append(line_number)
+        except (ValueError, IndexError) as e:
+            errors.append({"line": line_number, "field": None, "error": f"Ошибка парсинга строки: {e}"})
+
+    clients, row_errors = Client.validate_many(rows)
+    for error in row_errors:
+        errors.append({"line": line_numbers[error["row"]], "field": error["field"], "error": error["error"]})
+    errors.sort(key=lambda error: error["line"])
+    return clients, errors
+
+
+class _InlineExecutor(Executor):
+    """Выполнение задач в текущем процессе (workers=0, удобно для небольших файлов и отладки)"""
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+
+class ClientImportPipeline:
+    """
+    Потоковый импорт клиентов из файла с разделителями (формат Client.from_string).
+    Файл читается пакетами по chunk_size строк, разбор и проверка выполняются в пуле процессов,
+    результаты в исходном порядке записываются в репозиторий пакетами.
+    Память ограничена max_pending пакетами независимо от размера файла.
+    """
+
+    def __init__(
+        self,
+        repository,
+        delimiter: str = ",",
+        chunk_size: int = 5000,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        skip_header: bool = False,
+        max_errors: int = 1000,
+        progress: Optional[Callable[[ImportStats], None]] = None,
+    ):
+        """
+        Args:
+            repository: Репозиторий Client_rep_base (или декоратор) либо Client_rep_DB
+            delimiter: Разделитель полей
+            chunk_size: Количество строк в одном пакете
+            workers: Количество процессов (None - по числу ядер, 0 - без пула, в текущем процессе)
+            max_pending: Максимум пакетов в обработке одновременно (по умолчанию 2 * workers)
+            skip_header: Пропустить первую строку файла
+            max_errors: Сколько ошибок хранить в отчете (считаются все)
+            progress: Функция, вызываемая с ImportStats после каждого пакета
+        """
+        self.repository = repository
+        self.delimiter = delimiter
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.max_pending = max_pending
+        self.skip_header = skip_header
+        self.max_errors = max_errors
+        self.progress = progress
+
+    def _read_chunks(self, file_path: str, encoding: str) -> Iterator[List[Tuple[int, str]]]:
+        """Чтение файла пакетами непустых строк с номерами"""
+        with open(file_path, "r", encoding=encoding) as f:
+            numbered = ((number, line.rstrip("\r\n")) for number, line in enumerate(f, 1))
+            if self.skip_header:
+                next(numbered, None)
+            numbered = ((number, line) for number, line in numbered if line.strip())
+            while True:
+                chunk = list(islice(numbered, self.chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+
+    def _store(self, clients: List[Client], stats: ImportStats):
+        """
+        Запись пакета клиентов в репозиторий (одна запись файла или одна транзакция БД на пакет).
+        stats.imported увеличивается только на фактически записанных клиентов.
+        """
+        if hasattr(self.repository, "add_clients"):
+            # Пакет записывается одной транзакцией: при ошибке не сохраняется ни один клиент
+            stats.imported += len(self.repository.add_clients(clients, self.chunk_size))
+        elif hasattr(self.repository, "batch"):
+            with self.repository.batch():
+                for client in clients:
+                    self.repository.add_client(client)
+                    stats.imported += 1
+        else:
+            for client in clients:
+                self.repository.add_client(client)
+                stats.imported += 1
+
+    def _collect(self, lines: Tuple[int, int], future: Future, stats: ImportStats):
+        clients, errors = future.result()
+        imported = stats.imported
+        try:
+            self._store(clients, stats)
+        except Exception as e:
+            stats.failed += len(clients) - (stats.imported - imported)
+            first, last = lines
+            errors = [{"line": first, "field": None, "error": f"Ошибка записи строк {first}-{last}: {e}"}] + errors
+        stats.add_errors(errors)
+        if self.progress:
+            self.progress(stats)
+
+    def run(self, file_path: str, encoding: str = "utf-8") -> ImportStats:
+        """
+        Импорт файла в репозиторий.
+
+        Args:
+            file_path: Путь к файлу с разделителями
+            encoding: Кодировка файла
+
+        Returns:
+            Итоговая статистика импорта
+        """
+        stats = ImportStats(self.max_errors)
+        if self.workers == 0:
+            executor = _InlineExecutor()
+            max_pending = 1
+        else:
+            workers = self.workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(max_workers=workers)
+            max_pending = self.max_pending or 2 * workers
+
+        pending = deque()
+        with executor:
+            for chunk in self._read_chunks(file_path, encoding):
+                stats.rows_read += len(chunk)
+                lines = (chunk[0][0], chunk[-1][0])
+                pending.append((lines, executor.submit(_parse_chunk, chunk, self.delimiter)))
+                # Ограничение памяти: ждем самый старый пакет, сохраняя порядок строк
+                if len(pending) >= max_pending:
+                    self._collect(*pending.popleft(), stats)
+            while pending:
+                self._collect(*pending.popleft(), stats)
+        return stats
@@ -1,8 +1,25 @@
-from typing import List, Optional
+import uuid
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import psycopg2
+from psycopg2.extras import execute_values
 
 from travel_agency.Client import Client
+from travel_agency.Client_rep_base import PAGE_ORDERS, decode_page_cursor, encode_page_cursor
 from travel_agency.DBConnection import DBConnection
 
+# Выражения должны совпадать с индексами в database_setup.sql и с Client.normalize_*
+_PHONE_KEY_SQL = r"right(regexp_replace(phone_number, '\D', '', 'g'), 10)"
+_PASPORT_KEY_SQL = r"regexp_replace(pasport, '\D', '', 'g')"
+
+_DATA_COLUMNS = "surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance"
+# Допустимые ключи конфликта upsert_clients: цель ON CONFLICT (уникальный индекс в database_setup.sql)
+_CONFLICT_TARGETS = {
+    "id": "(id)",
+    "pasport": f"(({_PASPORT_KEY_SQL}))",
+}
+
 
 class Client_rep_DB:
     """
@@ -25,20 +42,34 @@ class Client_rep_DB:
             Объект Client
         """
         # row format: (id, surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance, ...)
-        birth_date_str = row[4].strftime("%d.%m.%Y") if row[4] else None
+        # Данные из собственной БД уже проверены - создаем объект без повторной валидации
+        return Client.from_row(row)
+
+    @staticmethod
+    def _client_params(client: Client) -> tuple:
+        """Значения колонок _DATA_COLUMNS для клиента"""
+        # Преобразование даты рождения
+        birth_date = None
+        if client.get_birth_date():
+            birth_date = client.get_birth_date().strftime("%Y-%m-%d")
 
-        return Client(
-            id=row[0],
-            surname=row[1],
-            firstname=row[2],
-            fathers_name=row[3],
-            birth_date=birth_date_str,
-            phone_number=row[5],
-            pasport=row[6],
-            email=row[7],
-            balance=float(row[8]) if row[8] else None,
+        return (
+            client.get_surname(),
+            client.get_firstname(),
+            client.get_fathers_name(),
+            birth_date,
+            client.get_phone_number(),
+            client.get_pasport(),
+            client.get_email(),
+            client.get_balance(),
         )
 
+    @staticmethod
+    def _short_row(row: tuple) -> tuple:
+        """Строка (id, surname, firstname, fathers_name, birth_date, email) в формате short_information"""
+        birth_date_str = row[4].strftime("%d.%m.%Y") if row[4] else None
+        return (row[0], row[1], row[2], row[3], birth_date_str, row[5])
+
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """
         a. Получить объект по ID
@@ -65,6 +96,110 @@ class Client_rep_DB:
             print(f"Ошибка получения клиента: {e}")
             return None
 
+    def find_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> List[Client]:
+        """
+        Найти клиентов по ФИО и дате рождения (использует индекс idx_clients_identity)
+
+        Args:
+            surname: Фамилия
+            firstname: Имя
+            fathers_name: Отчество
+            birth_date: Дата рождения (date)
+
+        Returns:
+            Список найденных клиентов
+        """
+        key = Client.make_identity_key(surname, firstname, fathers_name, birth_date)
+        query = """
+            SELECT id, surname, firstname, fathers_name, birth_date,
+                   phone_number, pasport, email, balance
+            FROM clients
+            WHERE lower(surname) = %s AND lower(firstname) = %s
+        """
+        params = [key[0], key[1]]
+        if birth_date is None:
+            query += " AND birth_date IS NULL"
+        else:
+            query += " AND birth_date = %s"
+            params.append(birth_date)
+
+        try:
+            rows = self.db.execute_query(query, tuple(params))
+            # Окончательное сравнение по нормализованному ключу (пробелы по краям, отчество)
+            clients = [self._row_to_client(row) for row in rows]
+            return [client for client in clients if client.identity_key == key]
+        except Exception as e:
+            print(f"Ошибка поиска клиента: {e}")
+            return []
+
+    def _find_one_by(self, condition: str, value) -> Optional[Client]:
+        """
+        Поиск одного клиента по условию на индексированное выражение
+
+        Args:
+            condition: SQL выражение, сравниваемое с параметром
+            value: Нормализованное значение для сравнения
+
+        Returns:
+            Объект Client или None
+        """
+        if value is None:
+            return None
+
+        query = f"""
+            SELECT id, surname, firstname, fathers_name, birth_date,
+                   phone_number, pasport, email, balance
+            FROM clients
+            WHERE {condition} = %s
+            ORDER BY id
+            LIMIT 1
+        """
+
+        try:
+            row = self.db.execute_query_one(query, (value,))
+            if row:
+                return self._row_to_client(row)
+            return None
+        except Exception as e:
+            print(f"Ошибка поиска клиента: {e}")
+            return None
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """
+        Найти клиента по email без учета регистра (индекс idx_clients_email_lower)
+
+        Args:
+            email: Email клиента
+
+        Returns:
+            Объект Client или None
+        """
+        return self._find_one_by("lower(email)", Client.normalize_email(email))
+
+    def find_by_phone(self, phone_number: str) -> Optional[Client]:
+        """
+        Найти клиента по нормализованному телефону (индекс idx_clients_phone_normalized)
+
+        Args:
+            phone_number: Номер телефона
+
+        Returns:
+            Объект Client или None
+        """
+        return self._find_one_by(_PHONE_KEY_SQL, Client.normalize_phone(phone_number))
+
+    def find_by_passport(self, pasport: str) -> Optional[Client]:
+        """
+        Найти клиента по паспорту, сравнивая только цифры (индекс idx_clients_pasport_normalized)
+
+        Args:
+            pasport: Серия и номер паспорта
+
+        Returns:
+            Объект Client или None
+        """
+        return self._find_one_by(_PASPORT_KEY_SQL, Client.normalize_pasport(pasport))
+
     def get_k_n_short_list(self, k: int, n: int) -> List[tuple]:
         """
         b. Получить список k по счету n объектов класса short
@@ -88,16 +223,60 @@ class Client_rep_DB:
         try:
             rows = self.db.execute_query(query, (n, offset))
             # Возвращаем в формате short_information
-            result = []
-            for row in rows:
-                # (id, surname, firstname, fathers_name, birth_date, email)
-                birth_date_str = row[4].strftime("%d.%m.%Y") if row[4] else None
-                result.append((row[0], row[1], row[2], row[3], birth_date_str, row[5]))
-            return result
+            return [self._short_row(row) for row in rows]
         except Exception as e:
             print(f"Ошибка получения списка: {e}")
             return []
 
+    def get_page_after(
+        self, cursor: Optional[str] = None, n: int = 20, order: str = "id"
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        Постраничный вывод по курсору (keyset): WHERE (ключ) > (курсор) ORDER BY ключ LIMIT n.
+        В отличие от LIMIT/OFFSET база не перебирает пропущенные строки, а чтение идет
+        по первичному ключу или индексу idx_clients_surname (surname, id).
+
+        Args:
+            cursor: Курсор из предыдущего вызова (None - первая страница)
+            n: Количество элементов на странице
+            order: Порядок страниц: "id" или "surname" (фамилия, затем ID)
+
+        Returns:
+            Пара (список кортежей с краткой информацией, курсор следующей страницы или None для последней)
+
+        Raises:
+            ValueError: Если порядок не поддерживается или курсор неверен
+        """
+        after = decode_page_cursor(cursor, order)
+        fields = PAGE_ORDERS[order]
+        key = ", ".join(fields)
+        condition, params = "", ()
+        if after is not None:
+            condition = f"WHERE ({key}) > ({', '.join(['%s'] * len(fields))})"
+            params = tuple(after)
+
+        # Лишняя строка показывает, есть ли следующая страница
+        query = f"""
+            SELECT id, surname, firstname, fathers_name, birth_date, email
+            FROM clients
+            {condition}
+            ORDER BY {key}
+            LIMIT %s
+        """
+
+        try:
+            rows = self.db.execute_query(query, params + (n + 1,))
+        except Exception as e:
+            print(f"Ошибка получения страницы: {e}")
+            return [], None
+
+        next_cursor = None
+        if len(rows) > n:
+            rows = rows[:n]
+            # Поля ключа в выбранных колонках: id - 0, surname - 1
+            next_cursor = encode_page_cursor(order, [rows[-1][0 if field == "id" else 1] for field in fields])
+        return [self._short_row(row) for row in rows], next_cursor
+
     def add_client(self, client: Client) -> Optional[Client]:
         """
         c. Добавить объект в список (ID генерируется автоматически БД)
@@ -116,24 +295,8 @@ class Client_rep_DB:
                       phone_number, pasport, email, balance
         """
 
-        # Преобразование даты рождения
-        birth_date = None
-        if client.get_birth_date():
-            birth_date = client.get_birth_date().strftime("%Y-%m-%d")
-
-        params = (
-            client.get_surname(),
-            client.get_firstname(),
-            client.get_fathers_name(),
-            birth_date,
-            client.get_phone_number(),
-            client.get_pasport(),
-            client.get_email(),
-            client.get_balance(),
-        )
-
         try:
-            row = self.db.execute_query_one(query, params)
+            row = self.db.execute_query_one(query, self._client_params(client))
             if row:
                 return self._row_to_client(row)
             return None
@@ -141,6 +304,95 @@ class Client_rep_DB:
             print(f"Ошибка добавления клиента: {e}")
             return None
 
+    def _insert_batches(self, query: str, rows: Iterator[tuple], batch_size: int, after=None) -> List[int]:
+        """
+        Выполнение INSERT ... VALUES %s RETURNING id пакетами по batch_size строк (execute_values)
+        в одной транзакции: при ошибке не сохраняется ни одна строка.
+
+        Args:
+            query: Запрос с одним заполнителем VALUES %s
+            rows: Строки значений
+            batch_size: Количество строк в одном запросе
+            after: Запрос, выполняемый в той же транзакции после вставки
+
+        Returns:
+            ID вставленных (обновленных) строк в порядке rows
+        """
+        ids = []
+        with self.db.connection() as conn:
+            try:
+                with conn.cursor() as cursor:
+                    while True:
+                        batch = list(islice(rows, batch_size))
+                        if not batch:
+                            break
+                        result = execute_values(cursor, query, batch, page_size=batch_size, fetch=True)
+                        ids.extend(row[0] for row in result)
+                    if after:
+                        cursor.execute(after)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+        return ids
+
+    def add_clients(self, clients: Iterable[Client], batch_size: int = 1000) -> List[int]:
+        """
+        Массовое добавление клиентов: один многострочный INSERT на batch_size клиентов
+        и одна фиксация транзакции на все добавление (вместо запроса и фиксации на каждого клиента)
+
+        Args:
+            clients: Клиенты для добавления (можно передавать генератор)
+            batch_size: Количество клиентов в одном запросе
+
+        Returns:
+            Сгенерированные ID в порядке clients
+
+        Raises:
+            psycopg2.Error: При ошибке БД (транзакция откатывается, не добавлен ни один клиент)
+        """
+        query = f"INSERT INTO clients ({_DATA_COLUMNS}) VALUES %s RETURNING id"
+        rows = (self._client_params(client) for client in clients)
+        return self._insert_batches(query, rows, batch_size)
+
+    def upsert_clients(
+        self, clients: Iterable[Client], conflict_key: str = "pasport", batch_size: int = 1000
+    ) -> List[int]:
+        """
+        Массовое добавление или обновление клиентов (INSERT ... ON CONFLICT DO UPDATE) в одной транзакции.
+        Клиент, совпавший по ключу с существующей записью, заменяет ее поля.
+        Ключи клиентов внутри одного пакета должны быть различны (ограничение ON CONFLICT в PostgreSQL).
+
+        Args:
+            clients: Клиенты (можно передавать генератор)
+            conflict_key: Ключ совпадения: "pasport" (паспорт, только цифры) или "id" (ID клиента)
+            batch_size: Количество клиентов в одном запросе
+
+        Returns:
+            ID добавленных и обновленных записей
+
+        Raises:
+            ValueError: Если ключ конфликта не поддерживается
+            psycopg2.Error: При ошибке БД (транзакция откатывается, не изменена ни одна запись)
+        """
+        target = _CONFLICT_TARGETS.get(conflict_key)
+        if target is None:
+            supported = ", ".join(_CONFLICT_TARGETS)
+            raise ValueError(f"Неподдерживаемый ключ конфликта: {conflict_key} (допустимы: {supported})")
+
+        columns = _DATA_COLUMNS
+        updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in _DATA_COLUMNS.split(", "))
+        after = None
+        if conflict_key == "id":
+            columns = "id, " + columns
+            rows = ((client.get_id(),) + self._client_params(client) for client in clients)
+            # Явно заданные ID не продвигают последовательность SERIAL - выравниваем ее по максимальному ID
+            after = "SELECT setval(pg_get_serial_sequence('clients', 'id'), GREATEST((SELECT MAX(id) FROM clients), 1))"
+        else:
+            rows = (self._client_params(client) for client in clients)
+        query = f"INSERT INTO clients ({columns}) VALUES %s ON CONFLICT {target} DO UPDATE SET {updates} RETURNING id"
+        return self._insert_batches(query, rows, batch_size, after)
+
     def replace_by_id(self, client_id: int, new_client: Client) -> bool:
         """
         d. Заменить элемент списка по ID
@@ -159,22 +411,7 @@ class Client_rep_DB:
             WHERE id = %s
         """
 
-        # Преобразование даты рождения
-        birth_date = None
-        if new_client.get_birth_date():
-            birth_date = new_client.get_birth_date().strftime("%Y-%m-%d")
-
-        params = (
-            new_client.get_surname(),
-            new_client.get_firstname(),
-            new_client.get_fathers_name(),
-            birth_date,
-            new_client.get_phone_number(),
-            new_client.get_pasport(),
-            new_client.get_email(),
-            new_client.get_balance(),
-            client_id,
-        )
+        params = self._client_params(new_client) + (client_id,)
 
         try:
             self.db.execute_query(query, params, fetch=False)
@@ -238,3 +475,42 @@ class Client_rep_DB:
         except Exception as e:
             print(f"Ошибка чтения всех клиентов: {e}")
             return []
+
+    def iter_all(self, batch_size: int = 1000, short: bool = False) -> Iterator[Union[Client, tuple]]:
+        """
+        Потоковое чтение всех записей через именованный (серверный) курсор: строки передаются
+        порциями по batch_size, поэтому память клиента не зависит от размера таблицы.
+        Курсор объявлен WITH HOLD и не закрывается фиксацией транзакций во время обхода.
+        Генератор следует обходить в том потоке, где он создан (соединение пула закреплено за потоком).
+
+        Args:
+            batch_size: Количество строк, получаемых с сервера за один раз
+            short: Если True, возвращаются кортежи short_information вместо объектов Client
+
+        Returns:
+            Генератор объектов Client (или кортежей) в порядке ID
+
+        Raises:
+            psycopg2.Error: При ошибке БД, в том числе посреди обхода (неполный результат не выдается за полный)
+        """
+        if short:
+            columns = "id, surname, firstname, fathers_name, birth_date, email"
+            convert = self._short_row
+        else:
+            columns = "id, surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance"
+            convert = self._row_to_client
+        query = f"SELECT {columns} FROM clients ORDER BY id"
+
+        with self.db.connection() as conn:
+            cursor = conn.cursor(name=f"clients_{uuid.uuid4().hex}", withhold=True)
+            cursor.itersize = batch_size
+            try:
+                cursor.execute(query)
+                for row in cursor:
+                    yield convert(row)
+            finally:
+                try:
+                    cursor.close()
+                except psycopg2.Error:
+                    # Соединение уже разорвано: курсор закрыт вместе с ним, важнее исходная ошибка
+                    pass
@@ -1,7 +1,7 @@
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from travel_agency.Client import Client
-from travel_agency.Client_rep_base import Client_rep_base
+from travel_agency.Client_rep_base import Client_rep_base, ClientListView, ReloadDiff
 from travel_agency.Client_rep_DB import Client_rep_DB
 
 
@@ -15,15 +15,16 @@ class Client_rep_DB_adapter(Client_rep_base):
         """Инициализация адаптера с объектом Client_rep_DB"""
         # Не вызываем super().__init__(), так как не работаем с файлами
         self.file_path = "database"  # Для совместимости с базовым классом
-        self._clients: List[Client] = []
+        self._init_state()
         self._db_repo = Client_rep_DB()
 
     def _load_from_file(self):
         """
         Переопределение абстрактного метода.
-        Загрузка данных из БД вместо файла.
+        Загрузка данных из БД вместо файла (потоково, без промежуточного списка строк).
         """
-        self._clients = self._db_repo.read_all()
+        self._clients = list(self._db_repo.iter_all())
+        self._rebuild_index()
 
     def write_all(self):
         """
@@ -33,12 +34,17 @@ class Client_rep_DB_adapter(Client_rep_base):
         # В БД данные записываются немедленно при каждой операции
         pass
 
-    def reload_from_file(self):
+    def reload_from_file(self, force: bool = False) -> ReloadDiff:
         """
         Переопределение метода reload_from_file.
         Для БД перезагружает данные из базы данных.
+
+        Returns:
+            Разница по ID (все оставшиеся клиенты считаются измененными)
         """
+        old_ids = [client.get_id() for client in self._clients]
         self._load_from_file()
+        return ReloadDiff.from_ids(old_ids, (client.get_id() for client in self._clients))
 
     def sort_by_field(self, reverse: bool = False):
         """
@@ -46,7 +52,7 @@ class Client_rep_DB_adapter(Client_rep_base):
         Сортировка по фамилии (загружаем из БД и сортируем в памяти).
         """
         self._load_from_file()
-        self._clients.sort(key=lambda client: client.get_surname() if client.get_surname() else "", reverse=reverse)
+        self._sort_clients(lambda client: client.get_surname() if client.get_surname() else "", reverse)
 
     def read_all(self) -> List[Client]:
         """
@@ -57,6 +63,38 @@ class Client_rep_DB_adapter(Client_rep_base):
         """
         return self._db_repo.read_all()
 
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Client]:
+        """
+        Потоковый обход всех клиентов из БД через серверный курсор
+
+        Args:
+            batch_size: Количество строк, получаемых с сервера за один раз
+
+        Returns:
+            Генератор объектов Client
+        """
+        return self._db_repo.iter_all(batch_size)
+
+    def view(self) -> ClientListView:
+        """
+        Все клиенты из БД в виде последовательности только для чтения
+
+        Returns:
+            Объект ClientListView
+        """
+        return ClientListView(self._db_repo.read_all())
+
+    def get_frame(self):
+        """
+        Колоночное представление данных из БД (без кэширования, так как БД может меняться извне)
+
+        Returns:
+            Объект ClientFrame
+        """
+        from travel_agency.ClientFrame import ClientFrame
+
+        return ClientFrame(self._db_repo.read_all())
+
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """
         Получить объект по ID из БД
@@ -82,6 +120,54 @@ class Client_rep_DB_adapter(Client_rep_base):
         """
         return self._db_repo.get_k_n_short_list(k, n)
 
+    def get_page_after(
+        self, cursor: Optional[str] = None, n: int = 20, order: str = "id"
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        Постраничный вывод по курсору из БД
+
+        Args:
+            cursor: Курсор из предыдущего вызова (None - первая страница)
+            n: Количество элементов на странице
+            order: Порядок страниц: "id" или "surname"
+
+        Returns:
+            Пара (список кортежей с краткой информацией, курсор следующей страницы или None)
+        """
+        return self._db_repo.get_page_after(cursor, n, order)
+
+    def find_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> List[Client]:
+        """
+        Найти клиентов по ФИО и дате рождения в БД
+
+        Returns:
+            Список найденных клиентов
+        """
+        return self._db_repo.find_by_identity(surname, firstname, fathers_name, birth_date)
+
+    def is_client_unique(self, client: Client) -> bool:
+        """
+        Проверка уникальности клиента по ФИО и дате рождения в БД
+
+        Returns:
+            True если такого клиента нет
+        """
+        return not self._db_repo.find_by_identity(
+            client.get_surname(), client.get_firstname(), client.get_fathers_name(), client.get_birth_date()
+        )
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Найти клиента по email в БД"""
+        return self._db_repo.find_by_email(email)
+
+    def find_by_phone(self, phone_number: str) -> Optional[Client]:
+        """Найти клиента по телефону в БД"""
+        return self._db_repo.find_by_phone(phone_number)
+
+    def find_by_passport(self, pasport: str) -> Optional[Client]:
+        """Найти клиента по паспорту в БД"""
+        return self._db_repo.find_by_passport(pasport)
+
     def add_client(self, client: Client) -> Client:
         """
         Добавить клиента в БД
@@ -97,6 +183,35 @@ class Client_rep_DB_adapter(Client_rep_base):
             return added_client
         raise Exception("Ошибка добавления клиента в БД")
 
+    def add_clients(self, clients: Iterable[Client], batch_size: int = 1000) -> List[int]:
+        """
+        Массовое добавление клиентов в БД одной транзакцией
+
+        Args:
+            clients: Клиенты для добавления
+            batch_size: Количество клиентов в одном запросе
+
+        Returns:
+            Сгенерированные ID в порядке clients
+        """
+        return self._db_repo.add_clients(clients, batch_size)
+
+    def upsert_clients(
+        self, clients: Iterable[Client], conflict_key: str = "pasport", batch_size: int = 1000
+    ) -> List[int]:
+        """
+        Массовое добавление или обновление клиентов в БД одной транзакцией
+
+        Args:
+            clients: Клиенты
+            conflict_key: Ключ совпадения: "pasport" или "id"
+            batch_size: Количество клиентов в одном запросе
+
+        Returns:
+            ID добавленных и обновленных записей
+        """
+        return self._db_repo.upsert_clients(clients, conflict_key, batch_size)
+
     def replace_by_id(self, client_id: int, new_client: Client) -> bool:
         """
         Заменить клиента по ID в БД
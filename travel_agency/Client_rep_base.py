@@ -1,7 +1,138 @@
+import atexit
+import base64
+import bisect
+import hashlib
+import json
+import marshal
+import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections.abc import Sequence
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 from travel_agency.Client import Client
+from travel_agency.ClientIdentityIndex import (
+    ClientIdentityIndex,
+    ClientKeyIndex,
+    email_key,
+    pasport_key,
+    phone_key,
+)
+
+# Фабрики поддерживаемых индексов по полям (строятся лениво при первом поиске);
+# аргументы: клиенты и функция получения клиента по ID (None - индекс хранит объекты)
+_INDEX_FACTORIES: Dict[str, Callable[..., ClientKeyIndex]] = {
+    "identity": ClientIdentityIndex,
+    "email": lambda clients, resolve: ClientKeyIndex(email_key, clients, resolve),
+    "phone": lambda clients, resolve: ClientKeyIndex(phone_key, clients, resolve),
+    "pasport": lambda clients, resolve: ClientKeyIndex(pasport_key, clients, resolve),
+}
+
+# Версия формата файла-снимка (при изменении формата старые снимки игнорируются)
+_SNAPSHOT_VERSION = 1
+
+# Поля записи файла в порядке, используемом для хэша содержимого записи
+_RECORD_FIELDS = (
+    "id",
+    "surname",
+    "firstname",
+    "fathers_name",
+    "birth_date",
+    "phone_number",
+    "pasport",
+    "email",
+    "balance",
+)
+
+# Реестр открытых репозиториев процесса: (класс, абсолютный путь) -> экземпляр
+_registry: "weakref.WeakValueDictionary[Tuple[type, str], Client_rep_base]" = weakref.WeakValueDictionary()
+_registry_lock = threading.Lock()
+
+# Порядки постраничного вывода по курсору (get_page_after): поля ключа, последним всегда идет ID
+PAGE_ORDERS: Dict[str, Tuple[str, ...]] = {
+    "id": ("id",),
+    "surname": ("surname", "id"),
+}
+
+
+def encode_page_cursor(order: str, values: List[Any]) -> str:
+    """Непрозрачный курсор страницы: порядок и значения ключа последней выданной записи"""
+    data = json.dumps([order, *values], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(data).decode("ascii")
+
+
+def decode_page_cursor(cursor: Optional[str], order: str) -> Optional[List[Any]]:
+    """
+    Значения ключа из курсора encode_page_cursor (None для первой страницы)
+
+    Raises:
+        ValueError: Если порядок не поддерживается, курсор поврежден или выдан для другого порядка
+    """
+    fields = PAGE_ORDERS.get(order)
+    if fields is None:
+        raise ValueError(f"Неподдерживаемый порядок страниц: {order}")
+    if cursor is None:
+        return None
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, AttributeError):
+        data = None
+    if not isinstance(data, list) or len(data) != len(fields) + 1 or data[0] != order:
+        raise ValueError("Неверный курсор страницы")
+    return data[1:]
+
+
+class ReloadDiff:
+    """Результат перезагрузки: ID добавленных, измененных и удаленных клиентов"""
+
+    def __init__(self, added: Iterable = (), changed: Iterable = (), removed: Iterable = ()):
+        self.added = list(added)
+        self.changed = list(changed)
+        self.removed = list(removed)
+
+    @classmethod
+    def from_ids(cls, old_ids: Iterable, new_ids: Iterable) -> "ReloadDiff":
+        """Разница по спискам ID, когда содержимое записей не сравнивалось (оставшиеся считаются измененными)"""
+        old_ids = dict.fromkeys(old_ids)
+        new_ids = dict.fromkeys(new_ids)
+        return cls(
+            [client_id for client_id in new_ids if client_id not in old_ids],
+            [client_id for client_id in old_ids if client_id in new_ids],
+            [client_id for client_id in old_ids if client_id not in new_ids],
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __repr__(self):
+        return f"ReloadDiff(added={self.added}, changed={self.changed}, removed={self.removed})"
+
+
+class ClientListView(Sequence):
+    """
+    Представление списка клиентов только для чтения (без копирования).
+    Срез возвращает новый список, изменить исходный список через представление нельзя.
+    """
+
+    __slots__ = ("_clients",)
+
+    def __init__(self, clients: Sequence):
+        self._clients = clients
+
+    def __getitem__(self, i):
+        return self._clients[i]
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __iter__(self) -> Iterator[Client]:
+        return iter(self._clients)
+
+    def __repr__(self):
+        return f"ClientListView({len(self._clients)} клиентов)"
 
 
 class Client_rep_base(ABC):
@@ -10,6 +141,31 @@ class Client_rep_base(ABC):
     Определяет общий интерфейс для работы с различными форматами хранения данных.
     """
 
+    # Использовать двоичный снимок разобранных данных рядом с файлом (включается наследниками)
+    snapshot = False
+    # Один экземпляр (и одна копия данных) на файл в пределах процесса
+    _shared_by_path = False
+    # Список клиентов можно заменять новыми версиями (наследники, изменяющие записи на месте, отключают)
+    _supports_copy_on_write = True
+    # Индексы поиска хранят ID и получают клиентов через get_by_id (для наследников, не держащих всех в памяти)
+    _index_by_id = False
+
+    def __new__(cls, file_path: Optional[str] = None, *args, **kwargs):
+        """
+        Для классов с _shared_by_path повторное открытие того же файла возвращает уже созданный экземпляр.
+        Экземпляр живет, пока на него есть ссылки; параметры задаются при первом открытии,
+        при повторном они должны совпадать или не задаваться (_reuse_shared).
+        """
+        if not cls._shared_by_path or file_path is None:
+            return super().__new__(cls)
+        key = (cls, os.path.abspath(file_path))
+        with _registry_lock:
+            instance = _registry.get(key)
+            if instance is None:
+                instance = super().__new__(cls)
+                _registry[key] = instance
+            return instance
+
     def __init__(self, file_path: str):
         """
         Инициализация репозитория.
@@ -17,9 +173,67 @@ class Client_rep_base(ABC):
         Args:
             file_path: Путь к файлу для хранения данных
         """
+        if self._reuse_shared():
+            return
         self.file_path = file_path
-        self._clients: List[Client] = []
+        self._init_state()
         self._load_from_file()
+        self._rebuild_index()
+        self._loaded_signature = self._file_signature()
+        self._initialized = True
+
+    def _reuse_shared(self, **options) -> bool:
+        """
+        Проверка повторного открытия общего экземпляра (вызывается в начале __init__ наследников).
+        Если файл изменился на диске, а несохраненных изменений нет, данные перечитываются.
+
+        Args:
+            options: Параметры конструктора наследника (имя атрибута -> значение, None - не задан)
+
+        Returns:
+            True если экземпляр уже инициализирован
+
+        Raises:
+            ValueError: Если заданный параметр отличается от параметра уже открытого экземпляра
+        """
+        if not getattr(self, "_initialized", False):
+            return False
+        for name, value in options.items():
+            current = getattr(self, name)
+            if value is not None and value != current:
+                raise ValueError(
+                    f"{type(self).__name__} для файла {self.file_path} уже открыт с {name}={current!r}, "
+                    f"повторное открытие с {name}={value!r} невозможно"
+                )
+        if not self._dirty:
+            self.reload_from_file()
+        return True
+
+    def _init_state(self):
+        """Инициализация состояния в памяти (используется и наследниками без файла)"""
+        self._clients: List[Client] = []
+        self._id_index: Dict[Any, int] = {}
+        self._next_id = 1
+        self._batch_depth = 0
+        self._dirty = False
+        self._dirty_count = 0
+        self._loaded_signature = None
+        self._lock = threading.RLock()
+        # Очередность записи в файл; захватывается только после self._lock (или без него)
+        self._write_lock = threading.RLock()
+        self._flusher: Optional[_WriteBehindFlusher] = None
+        # Режим копирования при записи: опубликованный список клиентов не изменяется на месте
+        self._copy_on_write = False
+        # Версия данных: увеличивается при каждом изменении, используется для кэшей
+        self._version = 0
+        self._frame = None
+        self._frame_version = -1
+        # Индексы по личности (ФИО + дата рождения), email, телефону и паспорту
+        self._indexes: Dict[str, ClientKeyIndex] = {}
+        # Упорядоченные ключи для get_page_after: порядок -> (версия, список, ключи, позиции)
+        self._page_indexes: Dict[str, Tuple] = {}
+        # Хэши содержимого записей ID -> хэш (None - еще не вычислены), для пословной перезагрузки
+        self._record_hashes: Optional[Dict[Any, int]] = None
 
     @abstractmethod
     def _load_from_file(self):
@@ -31,9 +245,400 @@ class Client_rep_base(ABC):
         """b. Запись всех значений в файл (абстрактный метод)"""
         pass
 
-    def reload_from_file(self):
-        """Принудительная перезагрузка данных из файла"""
-        self._load_from_file()
+    def _write_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """
+        Сохранение одного изменения (add/replace/delete).
+        По умолчанию перезаписывает весь файл, наследники могут писать изменение инкрементально.
+
+        Args:
+            operation: Тип операции ("add", "replace" или "delete")
+            client_id: ID измененного клиента
+            client: Новое состояние клиента (None для удаления)
+        """
+        self.write_all()
+
+    def _persist_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Сохранение изменения сразу или отложенно (пакет batch() или фоновая запись)"""
+        if self._batch_depth > 0:
+            self._dirty = True
+            return
+        if self._flusher is not None:
+            self._dirty = True
+            self._dirty_count += 1
+            if self._dirty_count >= self._flusher.max_dirty:
+                self._flusher.wake()
+            return
+        with self._write_lock:
+            self._write_change(operation, client_id, client)
+            self._loaded_signature = self._file_signature()
+
+    @contextmanager
+    def batch(self) -> Iterator["Client_rep_base"]:
+        """
+        Пакетный режим: внутри блока with изменения не записываются в файл,
+        при выходе из внешнего блока выполняется одна запись write_all().
+
+        Пример:
+            with repo.batch():
+                for client in clients:
+                    repo.add_client(client)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self):
+        """
+        Запись накопленных изменений в файл, если они есть (точка надежности).
+        Под блокировкой снимается только снимок данных (_snapshot_changes), сериализация и fsync
+        выполняются после ее освобождения и не задерживают изменения из других потоков.
+        При ошибке изменения снова помечаются несохраненными: следующий flush() повторит запись.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._dirty_count = 0
+            # Снимок и его запись - под одной блокировкой записи, чтобы старый снимок не записался после нового
+            self._write_lock.acquire()
+            try:
+                write = self._snapshot_changes()
+                if write is None:
+                    self._flush_changes()
+            except BaseException:
+                self._dirty = True
+                self._write_lock.release()
+                raise
+
+        try:
+            if write is not None:
+                write()
+            self._loaded_signature = self._file_signature()
+        except BaseException:
+            self._dirty = True
+            raise
+        finally:
+            self._write_lock.release()
+
+    def _snapshot_changes(self) -> Optional[Callable[[], None]]:
+        """
+        Снимок отложенных изменений для записи вне блокировки (вызывается под self._lock).
+
+        Returns:
+            Функция, записывающая снимок, или None - тогда _flush_changes() выполняется под блокировкой
+            (форматы, которые при записи изменяют собственное состояние)
+        """
+        return None
+
+    def _flush_changes(self):
+        """Запись отложенных изменений (по умолчанию - полная перезапись файла)"""
+        self.write_all()
+
+    def enable_write_behind(self, interval: float = 1.0, max_dirty: int = 100):
+        """
+        Включение отложенной фоновой записи: изменения выполняются только в памяти,
+        а фоновый поток записывает файл раз в interval секунд или после max_dirty изменений.
+        Для гарантированного сохранения вызывайте flush() или close().
+
+        Args:
+            interval: Интервал фоновой записи в секундах
+            max_dirty: Количество изменений, после которого запись выполняется досрочно
+        """
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = _WriteBehindFlusher(self, interval, max_dirty)
+            self._flusher.start()
+            atexit.register(self.close)
+
+    def enable_copy_on_write(self):
+        """
+        Включение режима копирования при записи для общего доступа из нескольких потоков.
+        Опубликованный список клиентов больше не изменяется на месте: изменение строит новую версию
+        под блокировкой записи и публикует ее одним присваиванием. Чтение (read_all, view, iter_all,
+        get_by_id, get_k_n_short_list, get_count) выполняется без блокировки и видит список
+        целиком до или целиком после изменения, а view() становится неизменяемым снимком.
+        Каждое изменение копирует список (O(n)), поэтому режим рассчитан на преобладание чтения.
+
+        Raises:
+            NotImplementedError: Если репозиторий изменяет записи на месте
+        """
+        if not self._supports_copy_on_write:
+            raise NotImplementedError(f"{type(self).__name__} не поддерживает режим копирования при записи")
+        with self._lock:
+            self._copy_on_write = True
+
+    def close(self):
+        """Остановка фоновой записи и сохранение всех изменений"""
+        flusher = self._flusher
+        if flusher is not None:
+            flusher.stop()
+            self._flusher = None
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _atomic_write(
+        self,
+        dump: Callable[[TextIO], None],
+        binary: bool = False,
+        before_replace: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Атомарная запись файла: данные пишутся во временный файл рядом с основным,
+        сбрасываются на диск (fsync) и только затем заменяют основной файл.
+
+        Args:
+            dump: Функция, записывающая содержимое в открытый файл
+            binary: Если True, файл открывается в двоичном режиме
+            before_replace: Вызывается перед заменой файла (например, чтобы закрыть mmap старого файла)
+        """
+        tmp_path = self.file_path + ".tmp"
+        try:
+            if binary:
+                f = open(tmp_path, "wb")
+            else:
+                f = open(tmp_path, "w", encoding="utf-8")
+            with f:
+                dump(f)
+                f.flush()
+                os.fsync(f.fileno())
+            if before_replace is not None:
+                before_replace()
+            os.replace(tmp_path, self.file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @property
+    def snapshot_path(self) -> str:
+        """Путь к файлу-снимку рядом с основным файлом"""
+        return self.file_path + ".snapshot"
+
+    def _file_digest(self) -> bytes:
+        """Хэш содержимого основного файла"""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(self.file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.digest()
+
+    def _load_snapshot(self) -> Optional[List[Client]]:
+        """
+        Загрузка клиентов из снимка, если он соответствует основному файлу (размер, время изменения и хэш).
+
+        Returns:
+            Список клиентов или None, если снимка нет или основной файл изменился
+        """
+        if not self.snapshot:
+            return None
+        try:
+            stat = os.stat(self.file_path)
+            with open(self.snapshot_path, "rb") as f:
+                # Чтение целиком и loads заметно быстрее, чем marshal.load из файла
+                version, size, mtime_ns, digest, rows = marshal.loads(f.read())
+            if (version, size, mtime_ns) != (_SNAPSHOT_VERSION, stat.st_size, stat.st_mtime_ns):
+                return None
+            if digest != self._file_digest():
+                return None
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+        return [
+            Client.from_trusted(
+                row[0],
+                row[1],
+                row[2],
+                row[3],
+                date.fromordinal(row[4]) if row[4] else None,
+                row[5],
+                row[6],
+                row[7],
+                row[8],
+            )
+            for row in rows
+        ]
+
+    def _save_snapshot(self, clients: List[Client]):
+        """Запись снимка разобранных клиентов (marshal кортежей); ошибки записи снимка не критичны"""
+        if not self.snapshot:
+            return
+        rows = [
+            (
+                client.get_id(),
+                client.get_surname(),
+                client.get_firstname(),
+                client.get_fathers_name(),
+                client.get_birth_date().toordinal() if client.get_birth_date() else None,
+                client.get_phone_number(),
+                client.get_pasport(),
+                client.get_email(),
+                client.get_balance(),
+            )
+            for client in clients
+        ]
+        tmp_path = self.snapshot_path + ".tmp"
+        try:
+            stat = os.stat(self.file_path)
+            data = (_SNAPSHOT_VERSION, stat.st_size, stat.st_mtime_ns, self._file_digest(), rows)
+            with open(tmp_path, "wb") as f:
+                f.write(marshal.dumps(data))
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _source_paths(self) -> List[str]:
+        """Файлы, изменение которых требует перезагрузки данных"""
+        return [self.file_path]
+
+    def _file_signature(self) -> Tuple:
+        """Размер и время изменения файлов данных (None для отсутствующего файла)"""
+        signature = []
+        for path in self._source_paths():
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def reload_from_file(self, force: bool = False) -> ReloadDiff:
+        """
+        Перезагрузка данных из файла. Без force файл перечитывается, только если
+        его размер или время изменения отличаются от загруженных (дешевая проверка stat).
+        Если формат поддерживает чтение записей (_read_items), объекты Client создаются заново
+        только для новых и измененных записей, остальные остаются прежними.
+
+        Args:
+            force: Перечитать файл без проверки
+
+        Returns:
+            ID добавленных, измененных и удаленных клиентов (для форматов без пословного
+            сравнения все оставшиеся клиенты считаются измененными)
+        """
+        with self._lock:
+            signature = self._file_signature()
+            if not force and signature == self._loaded_signature:
+                return ReloadDiff()
+
+            items = self._read_items()
+            if items is None:
+                old_ids = list(self._iter_client_ids())
+                self._load_from_file()
+                self._rebuild_index()
+                diff = ReloadDiff.from_ids(old_ids, self._id_index)
+            else:
+                diff = self._apply_items(items)
+            self._loaded_signature = signature
+            return diff
+
+    def _read_items(self) -> Optional[List[dict]]:
+        """
+        Записи файла в виде словарей полей (как в _client_to_dict) для пословной перезагрузки.
+        Наследник, реализующий метод, должен реализовать и _dict_to_client.
+
+        Returns:
+            Список словарей или None, если формат не поддерживает пословную перезагрузку
+        """
+        return None
+
+    def _client_to_dict(self, client: Client) -> dict:
+        """Преобразование объекта Client в словарь"""
+        birth_date_str = client.get_birth_date().strftime("%d.%m.%Y") if client.get_birth_date() else None
+        return {
+            "id": client.get_id(),
+            "surname": client.get_surname(),
+            "firstname": client.get_firstname(),
+            "fathers_name": client.get_fathers_name(),
+            "birth_date": birth_date_str,
+            "phone_number": client.get_phone_number(),
+            "pasport": client.get_pasport(),
+            "email": client.get_email(),
+            "balance": client.get_balance(),
+        }
+
+    @staticmethod
+    def _record_hash(item: dict) -> int:
+        """Хэш содержимого записи файла"""
+        return hash(tuple(item.get(field) for field in _RECORD_FIELDS))
+
+    def _apply_items(self, items: List[dict]) -> ReloadDiff:
+        """Замена данных записями файла с повторным использованием неизмененных объектов Client"""
+        old_by_id = {client.get_id(): client for client in self._clients}
+        hashes = self._record_hashes
+        if hashes is None:
+            # Первая пословная перезагрузка: хэши вычисляются по текущим объектам
+            hashes = {
+                client_id: self._record_hash(self._client_to_dict(client)) for client_id, client in old_by_id.items()
+            }
+
+        clients = []
+        new_hashes = {}
+        added, changed = [], []
+        for item in items:
+            client_id = item.get("id")
+            record_hash = self._record_hash(item)
+            new_hashes[client_id] = record_hash
+            old_client = old_by_id.pop(client_id, None)
+            if old_client is not None and hashes.get(client_id) == record_hash:
+                clients.append(old_client)
+                continue
+            clients.append(self._dict_to_client(item))
+            (added if old_client is None else changed).append(client_id)
+
+        self._clients = clients
+        self._rebuild_index()
+        self._record_hashes = new_hashes
+        return ReloadDiff(added, changed, old_by_id)
+
+    def _forget_record_hash(self, client_id: Any):
+        """Содержимое клиента изменено в памяти - его хэш из файла больше не действителен"""
+        if self._record_hashes is not None:
+            self._record_hashes.pop(client_id, None)
+
+    def _sort_clients(self, key: Callable[[Client], Any], reverse: bool = False):
+        """
+        Сортировка списка в памяти с перестроением индекса.
+
+        Args:
+            key: Функция ключа сортировки
+            reverse: Если True, сортировка в обратном порядке
+        """
+        with self._lock:
+            if self._copy_on_write:
+                self._clients = sorted(self._clients, key=key, reverse=reverse)
+            else:
+                self._clients.sort(key=key, reverse=reverse)
+            self._rebuild_index()
+
+    def _rebuild_index(self):
+        """
+        Перестроение индекса ID -> позиция в списке и счетчика следующего ID.
+        Вызывается после загрузки и сортировки, когда меняется порядок элементов.
+        """
+        self._version += 1
+        self._id_index = {client_id: i for i, client_id in enumerate(self._iter_client_ids())}
+        self._indexes = {}
+        int_ids = [client_id for client_id in self._id_index if isinstance(client_id, int)]
+        self._next_id = max(int_ids) + 1 if int_ids else 1
+
+    def _iter_client_ids(self) -> Iterator[Any]:
+        """ID клиентов в порядке списка (наследники могут получать их без создания объектов)"""
+        return (client.get_id() for client in self._clients)
+
+    def _client_id_at(self, position: int) -> Any:
+        """ID клиента на позиции position"""
+        return self._clients[position].get_id()
+
+    def _reindex_from(self, start: int):
+        """Обновление позиций в индексе начиная с позиции start (после удаления)"""
+        for i in range(start, len(self._clients)):
+            self._id_index[self._client_id_at(i)] = i
 
     def read_all(self) -> List[Client]:
         """
@@ -48,6 +653,42 @@ class Client_rep_base(ABC):
         """
         return self._clients.copy()
 
+    def iter_all(self) -> Iterator[Client]:
+        """
+        Обход всех клиентов без копирования списка
+
+        Returns:
+            Итератор по объектам Client в текущем порядке
+        """
+        return iter(self._clients)
+
+    def view(self) -> ClientListView:
+        """
+        Все клиенты в виде последовательности только для чтения, без копирования списка.
+        Представление ссылается на текущий список, поэтому изменения репозитория в нем видны
+        (в режиме enable_copy_on_write() - неизменяемый снимок); независимую копию дает read_all().
+
+        Returns:
+            Объект ClientListView
+        """
+        return ClientListView(self._clients)
+
+    def get_frame(self):
+        """
+        Колоночное представление текущих данных (ClientFrame) для векторных фильтров.
+        Кэшируется до следующего изменения репозитория. Требует NumPy.
+
+        Returns:
+            Объект ClientFrame
+        """
+        from travel_agency.ClientFrame import ClientFrame
+
+        with self._lock:
+            if self._frame is None or self._frame_version != self._version:
+                self._frame = ClientFrame(self._clients)
+                self._frame_version = self._version
+            return self._frame
+
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """
         c. Получить объект по ID
@@ -58,10 +699,19 @@ class Client_rep_base(ABC):
         Returns:
             Объект Client или None, если не найден
         """
-        for client in self._clients:
+        # Индекс читается раньше списка: изменения публикуют список, затем обновляют индекс
+        position = self._id_index.get(client_id)
+        if position is None:
+            return None
+        clients = self._clients
+        if position < len(clients):
+            client = clients[position]
             if client.get_id() == client_id:
                 return client
-        return None
+        # Позиция устарела из-за одновременного изменения - повторяем под блокировкой записи
+        with self._lock:
+            position = self._id_index.get(client_id)
+            return None if position is None else self._clients[position]
 
     def get_k_n_short_list(self, k: int, n: int) -> List[tuple]:
         """
@@ -84,6 +734,66 @@ class Client_rep_base(ABC):
         page_clients = self._clients[start_index:end_index]
         return [client.short_information for client in page_clients]
 
+    @staticmethod
+    def _page_values(order: str, client: Client) -> List[Any]:
+        """Значения ключа порядка order для клиента (содержимое курсора)"""
+        return [getattr(client, f"get_{field}")() for field in PAGE_ORDERS[order]]
+
+    @staticmethod
+    def _page_key(values: List[Any]) -> tuple:
+        """Ключ сравнения по значениям курсора: ID разных типов (int и строка UUID) упорядочиваются по типу"""
+        client_id = values[-1]
+        id_key = (0, client_id) if isinstance(client_id, int) else (1, str(client_id))
+        return (*values[:-1], id_key)
+
+    def _page_index(self, order: str) -> Tuple[Sequence, List[tuple], List[int]]:
+        """
+        Позиции клиентов, упорядоченные по ключу order, и сами ключи для двоичного поиска.
+        Строится за O(n log n) и кэшируется до следующего изменения репозитория.
+        """
+        with self._lock:
+            cached = self._page_indexes.get(order)
+            if cached is None or cached[0] != self._version or cached[1] is not self._clients:
+                clients = self._clients
+                if order == "id":
+                    # Для порядка по ID объекты Client не создаются
+                    keys = [self._page_key([client_id]) for client_id in self._iter_client_ids()]
+                else:
+                    keys = [self._page_key(self._page_values(order, client)) for client in clients]
+                positions = sorted(range(len(keys)), key=keys.__getitem__)
+                cached = (self._version, clients, [keys[position] for position in positions], positions)
+                self._page_indexes[order] = cached
+            return cached[1:]
+
+    def get_page_after(
+        self, cursor: Optional[str] = None, n: int = 20, order: str = "id"
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        Постраничный вывод по курсору: n объектов класса short, следующих за курсором в порядке order.
+        В отличие от get_k_n_short_list стоимость страницы не зависит от ее номера (двоичный поиск
+        по упорядоченным ключам), а добавление и удаление клиентов не сдвигает следующие страницы.
+
+        Args:
+            cursor: Курсор из предыдущего вызова (None - первая страница)
+            n: Количество элементов на странице
+            order: Порядок страниц: "id" или "surname" (фамилия, затем ID)
+
+        Returns:
+            Пара (список кортежей с краткой информацией, курсор следующей страницы или None для последней)
+
+        Raises:
+            ValueError: Если порядок не поддерживается или курсор неверен
+        """
+        after = decode_page_cursor(cursor, order)
+        clients, keys, positions = self._page_index(order)
+        start = bisect.bisect_right(keys, self._page_key(after)) if after is not None else 0
+        page = [clients[position] for position in positions[start : start + n]]
+
+        next_cursor = None
+        if page and start + n < len(positions):
+            next_cursor = encode_page_cursor(order, self._page_values(order, page[-1]))
+        return [client.short_information for client in page], next_cursor
+
     @abstractmethod
     def sort_by_field(self, reverse: bool = False):
         """
@@ -104,31 +814,34 @@ class Client_rep_base(ABC):
         Returns:
             Добавленный клиент с новым ID
         """
-        # Генерация нового ID
-        if self._clients:
-            max_id = max(c.get_id() for c in self._clients)
-            new_id = max_id + 1
-        else:
-            new_id = 1
-
-        # Создание нового клиента с новым ID
-        birth_date_str = client.get_birth_date().strftime("%d.%m.%Y") if client.get_birth_date() else None
+        with self._lock:
+            # Генерация нового ID из кэшированного счетчика
+            new_id = self._next_id
 
-        new_client = Client(
-            id=new_id,
-            surname=client.get_surname(),
-            firstname=client.get_firstname(),
-            fathers_name=client.get_fathers_name(),
-            birth_date=birth_date_str,
-            phone_number=client.get_phone_number(),
-            pasport=client.get_pasport(),
-            email=client.get_email(),
-            balance=client.get_balance(),
-        )
+            # Создание нового клиента с новым ID (поля уже проверены при создании client)
+            new_client = Client.from_trusted(
+                new_id,
+                client.get_surname(),
+                client.get_firstname(),
+                client.get_fathers_name(),
+                client.get_birth_date(),
+                client.get_phone_number(),
+                client.get_pasport(),
+                client.get_email(),
+                client.get_balance(),
+            )
 
-        self._clients.append(new_client)
-        self.write_all()
-        return new_client
+            if self._copy_on_write:
+                self._clients = self._clients + [new_client]
+            else:
+                self._clients.append(new_client)
+            self._id_index[new_id] = len(self._clients) - 1
+            self._next_id = new_id + 1
+            for index in self._indexes.values():
+                index.add(new_client)
+            self._version += 1
+            self._persist_change("add", new_id, new_client)
+            return new_client
 
     def replace_by_id(self, client_id: int, new_client: Client) -> bool:
         """
@@ -141,29 +854,36 @@ class Client_rep_base(ABC):
         Returns:
             True если замена успешна, False если клиент не найден
         """
-        for i, client in enumerate(self._clients):
-            if client.get_id() == client_id:
-                # Создаем нового клиента с сохранением ID
-                birth_date_str = (
-                    new_client.get_birth_date().strftime("%d.%m.%Y") if new_client.get_birth_date() else None
-                )
+        with self._lock:
+            position = self._id_index.get(client_id)
+            if position is None:
+                return False
 
-                updated_client = Client(
-                    id=client_id,
-                    surname=new_client.get_surname(),
-                    firstname=new_client.get_firstname(),
-                    fathers_name=new_client.get_fathers_name(),
-                    birth_date=birth_date_str,
-                    phone_number=new_client.get_phone_number(),
-                    pasport=new_client.get_pasport(),
-                    email=new_client.get_email(),
-                    balance=new_client.get_balance(),
-                )
+            # Создаем нового клиента с сохранением ID
+            updated_client = Client.from_trusted(
+                client_id,
+                new_client.get_surname(),
+                new_client.get_firstname(),
+                new_client.get_fathers_name(),
+                new_client.get_birth_date(),
+                new_client.get_phone_number(),
+                new_client.get_pasport(),
+                new_client.get_email(),
+                new_client.get_balance(),
+            )
 
-                self._clients[i] = updated_client
-                self.write_all()
-                return True
-        return False
+            for index in self._indexes.values():
+                index.replace(self._clients[position], updated_client)
+            if self._copy_on_write:
+                clients = list(self._clients)
+                clients[position] = updated_client
+                self._clients = clients
+            else:
+                self._clients[position] = updated_client
+            self._forget_record_hash(client_id)
+            self._version += 1
+            self._persist_change("replace", client_id, updated_client)
+            return True
 
     def delete_by_id(self, client_id: int) -> bool:
         """
@@ -175,12 +895,110 @@ class Client_rep_base(ABC):
         Returns:
             True если удаление успешно, False если клиент не найден
         """
-        for i, client in enumerate(self._clients):
-            if client.get_id() == client_id:
-                self._clients.pop(i)
-                self.write_all()
-                return True
-        return False
+        with self._lock:
+            position = self._id_index.pop(client_id, None)
+            if position is None:
+                return False
+
+            if self._copy_on_write:
+                deleted_client = self._clients[position]
+                self._clients = self._clients[:position] + self._clients[position + 1 :]
+            else:
+                deleted_client = self._clients.pop(position)
+            for index in self._indexes.values():
+                index.remove(deleted_client)
+            self._reindex_from(position)
+            self._forget_record_hash(client_id)
+            self._version += 1
+            self._persist_change("delete", client_id, None)
+            return True
+
+    def _get_index(self, name: str) -> ClientKeyIndex:
+        """
+        Индекс по полю name ("identity", "email", "phone", "pasport").
+        Строится при первом обращении и далее поддерживается при изменениях.
+        """
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is None:
+                index = _INDEX_FACTORIES[name](self._clients, self.get_by_id if self._index_by_id else None)
+                self._indexes[name] = index
+            return index
+
+    def find_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> List[Client]:
+        """
+        Найти клиентов по ФИО и дате рождения (без учета регистра и пробелов по краям)
+
+        Args:
+            surname: Фамилия
+            firstname: Имя
+            fathers_name: Отчество
+            birth_date: Дата рождения (date)
+
+        Returns:
+            Список найденных клиентов
+        """
+        return self._get_index("identity").find(surname, firstname, fathers_name, birth_date)
+
+    def is_client_unique(self, client: Client) -> bool:
+        """
+        Проверка, что клиента с такими же ФИО и датой рождения еще нет в репозитории
+
+        Args:
+            client: Проверяемый объект Client
+
+        Returns:
+            True если такого клиента нет
+        """
+        return client not in self._get_index("identity")
+
+    def delete_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> bool:
+        """
+        Удалить клиента по ФИО и дате рождения
+
+        Returns:
+            True если клиент найден и удален
+        """
+        matches = self.find_by_identity(surname, firstname, fathers_name, birth_date)
+        if not matches:
+            return False
+        return self.delete_by_id(matches[0].get_id())
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """
+        Найти клиента по email (без учета регистра)
+
+        Args:
+            email: Email клиента
+
+        Returns:
+            Объект Client или None
+        """
+        return self._get_index("email").first(Client.normalize_email(email))
+
+    def find_by_phone(self, phone_number: str) -> Optional[Client]:
+        """
+        Найти клиента по телефону (без учета пробелов, скобок, дефисов и префикса +7/8)
+
+        Args:
+            phone_number: Номер телефона
+
+        Returns:
+            Объект Client или None
+        """
+        return self._get_index("phone").first(Client.normalize_phone(phone_number))
+
+    def find_by_passport(self, pasport: str) -> Optional[Client]:
+        """
+        Найти клиента по паспортным данным (сравниваются только цифры)
+
+        Args:
+            pasport: Серия и номер паспорта
+
+        Returns:
+            Объект Client или None
+        """
+        return self._get_index("pasport").first(Client.normalize_pasport(pasport))
 
     def get_count(self) -> int:
         """
@@ -190,3 +1008,38 @@ class Client_rep_base(ABC):
             Количество клиентов в списке
         """
         return len(self._clients)
+
+
+class _WriteBehindFlusher(threading.Thread):
+    """Фоновый поток, периодически сбрасывающий изменения репозитория в файл"""
+
+    def __init__(self, repository: Client_rep_base, interval: float, max_dirty: int):
+        super().__init__(name=f"write-behind:{repository.file_path}", daemon=True)
+        self._repository = repository
+        self.interval = interval
+        self.max_dirty = max_dirty
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        # Ошибка последней фоновой записи (None после успешной записи)
+        self.last_error: Optional[Exception] = None
+
+    def run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            try:
+                self._repository.flush()
+                self.last_error = None
+            except Exception as e:
+                # Изменения остаются несохраненными: flush() или close() повторит запись и выбросит ошибку
+                self.last_error = e
+
+    def wake(self):
+        """Досрочная запись (накопилось много изменений)"""
+        self._wakeup.set()
+
+    def stop(self):
+        """Остановка потока с ожиданием завершения текущей записи"""
+        self._stopped.set()
+        self._wakeup.set()
+        self.join()
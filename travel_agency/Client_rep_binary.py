@@ -0,0 +1,347 @@
+import mmap
+import os
+import struct
+import uuid
+from collections.abc import MutableSequence
+from datetime import date
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+from travel_agency.Client import Client
+from travel_agency.Client_rep_base import Client_rep_base
+
+# Заголовок файла: сигнатура, версия формата, размер записи, количество занятых записей
+_HEADER = struct.Struct("<4sHHQ")
+_MAGIC = b"TACL"
+_FORMAT_VERSION = 1
+
+# Строковые поля и их максимальная длина в байтах UTF-8
+_STRING_FIELDS = (
+    ("surname", 96),
+    ("firstname", 96),
+    ("fathers_name", 96),
+    ("phone_number", 24),
+    ("pasport", 16),
+    ("email", 128),
+)
+
+# Запись: флаги, маска пустых строк, ID (int, UUID или строка до 16 байт), дата рождения (ordinal), баланс, строки
+_RECORD = struct.Struct("<BBq16sid" + "".join(f"{size}s" for _, size in _STRING_FIELDS))
+# Начало записи - для чтения ID без разбора строк
+_RECORD_ID = struct.Struct("<BBq16s")
+
+_LIVE = 1
+_UUID_ID = 2
+_HAS_BIRTH_DATE = 4
+_HAS_BALANCE = 8
+_STRING_ID = 16
+
+# Максимальная длина строкового ID в байтах UTF-8 (ID, генерируемые BaseClient, - 16 шестнадцатеричных символов)
+_STRING_ID_SIZE = 16
+
+# Меньше этого количества удаленных записей компактизация не выполняется
+_MIN_COMPACT_HOLES = 1024
+
+
+class _BinaryClientList(MutableSequence):
+    """
+    Список клиентов поверх записей файла: элементы хранятся как номера записей,
+    объект Client создается при обращении, присваивание перезаписывает запись на месте.
+    """
+
+    def __init__(self, repository: "Client_rep_binary", slots: List[int]):
+        self._repository = repository
+        self.slots = slots
+
+    def __getitem__(self, i):
+        read = self._repository._read_record
+        if isinstance(i, slice):
+            return [read(record) for record in self.slots[i]]
+        return read(self.slots[i])
+
+    def __setitem__(self, i, client: Client):
+        self._repository._write_record(self.slots[i], client)
+
+    def __delitem__(self, i):
+        self._repository._free_record(self.slots[i])
+        del self.slots[i]
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __iter__(self) -> Iterator[Client]:
+        read = self._repository._read_record
+        for record in self.slots:
+            yield read(record)
+
+    def insert(self, i: int, client: Client):
+        record = self._repository._allocate_record()
+        self._repository._write_record(record, client)
+        self.slots.insert(i, record)
+
+    def copy(self) -> List[Client]:
+        return list(self)
+
+    def sort(self, key: Callable[[Client], Any], reverse: bool = False):
+        read = self._repository._read_record
+        self.slots.sort(key=lambda record: key(read(record)), reverse=reverse)
+
+
+class Client_rep_binary(Client_rep_base):
+    """
+    Класс для работы с данными клиентов в двоичном файле записей фиксированной длины.
+    Наследуется от Client_rep_base.
+
+    Файл отображается в память (mmap), поэтому открытие не требует разбора данных:
+    читаются только ID для индекса, а клиенты создаются из записей по требованию.
+    get_by_id, replace_by_id и страницы get_k_n_short_list обращаются к записям по смещению,
+    замена перезаписывает запись на месте, удаление помечает запись как свободную.
+    Несколько процессов, открывших один файл, разделяют страницы отображения без копирования.
+
+    Строковые поля ограничены по длине (см. _STRING_FIELDS), ID - целое число, UUID или строка до 16 байт.
+    Порядок после сортировки и место удаленных записей сохраняются в файле при write_all().
+    """
+
+    # Замена и удаление перезаписывают записи файла на месте
+    _supports_copy_on_write = False
+
+    def __init__(self, file_path: str):
+        """
+        Инициализация репозитория.
+
+        Args:
+            file_path: Путь к файлу для хранения данных
+        """
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._record_count = 0
+        self._holes = 0
+        super().__init__(file_path)
+
+    def _open_map(self):
+        """Открытие файла (с созданием пустого) и отображение его в память"""
+        self._close_map()
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            with open(self.file_path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _RECORD.size, 0))
+        self._file = open(self.file_path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+        magic, version, record_size, record_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or version != _FORMAT_VERSION or record_size != _RECORD.size:
+            self._close_map()
+            raise ValueError(f"Файл {self.file_path} не является файлом клиентов поддерживаемой версии")
+        self._record_count = record_count
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load_from_file(self):
+        """Отображение файла и составление списка занятых записей (без создания объектов Client)"""
+        self._open_map()
+        slots = []
+        data = self._mmap
+        for record in range(self._record_count):
+            if data[_HEADER.size + record * _RECORD.size] & _LIVE:
+                slots.append(record)
+        self._holes = self._record_count - len(slots)
+        self._clients = _BinaryClientList(self, slots)
+
+    @staticmethod
+    def _record_offset(record: int) -> int:
+        return _HEADER.size + record * _RECORD.size
+
+    @staticmethod
+    def _unpack_id(flags: int, int_id: int, raw_id: bytes) -> Any:
+        """ID клиента из полей записи"""
+        if flags & _STRING_ID:
+            return raw_id.rstrip(b"\0").decode("utf-8")
+        if flags & _UUID_ID:
+            return str(uuid.UUID(bytes=raw_id))
+        return int_id
+
+    @staticmethod
+    def _pack_id(client_id: Any) -> Tuple[int, int, bytes]:
+        """
+        Кодирование ID клиента.
+
+        Returns:
+            Тройка (флаги, целый ID, байты строкового ID или UUID)
+
+        Raises:
+            ValueError: Если строковый ID длиннее 16 байт и не является UUID
+        """
+        if isinstance(client_id, int):
+            return 0, client_id, b""
+        raw_id = str(client_id).encode("utf-8")
+        if len(raw_id) <= _STRING_ID_SIZE:
+            return _STRING_ID, 0, raw_id
+        try:
+            return _UUID_ID, 0, uuid.UUID(str(client_id)).bytes
+        except ValueError:
+            raise ValueError(
+                f"ID {client_id!r} не помещается в запись: "
+                f"допустимы целые числа, UUID и строки до {_STRING_ID_SIZE} байт"
+            ) from None
+
+    def _id_at_record(self, record: int) -> Any:
+        flags, _, int_id, raw_id = _RECORD_ID.unpack_from(self._mmap, self._record_offset(record))
+        return self._unpack_id(flags, int_id, raw_id)
+
+    def _iter_client_ids(self) -> Iterator[Any]:
+        return (self._id_at_record(record) for record in self._clients.slots)
+
+    def _client_id_at(self, position: int) -> Any:
+        return self._id_at_record(self._clients.slots[position])
+
+    def _read_record(self, record: int) -> Client:
+        """Создание объекта Client из записи с номером record"""
+        flags, null_mask, int_id, raw_id, ordinal, balance, *strings = _RECORD.unpack_from(
+            self._mmap, self._record_offset(record)
+        )
+        values = [
+            None if null_mask & (1 << i) else raw.rstrip(b"\0").decode("utf-8") for i, raw in enumerate(strings)
+        ]
+        surname, firstname, fathers_name, phone_number, pasport, email = values
+        return Client.from_trusted(
+            self._unpack_id(flags, int_id, raw_id),
+            surname,
+            firstname,
+            fathers_name,
+            date.fromordinal(ordinal) if flags & _HAS_BIRTH_DATE else None,
+            phone_number,
+            pasport,
+            email,
+            balance if flags & _HAS_BALANCE else None,
+        )
+
+    @classmethod
+    def _pack_client(cls, client: Client) -> bytes:
+        """Упаковка клиента в запись фиксированной длины"""
+        id_flags, int_id, raw_id = cls._pack_id(client.get_id())
+        flags = _LIVE | id_flags
+
+        birth_date = client.get_birth_date()
+        ordinal = 0
+        if birth_date is not None:
+            ordinal = birth_date.toordinal()
+            flags |= _HAS_BIRTH_DATE
+
+        balance = client.get_balance()
+        if balance is not None:
+            flags |= _HAS_BALANCE
+
+        null_mask, strings = cls._pack_strings(client)
+        return _RECORD.pack(flags, null_mask, int_id, raw_id, ordinal, balance or 0.0, *strings)
+
+    @staticmethod
+    def _pack_strings(client: Client) -> Tuple[int, List[bytes]]:
+        """
+        Кодирование строковых полей клиента.
+
+        Returns:
+            Пара (маска пустых полей, значения в UTF-8)
+
+        Raises:
+            ValueError: Если поле длиннее отведенного места
+        """
+        null_mask = 0
+        strings = []
+        for i, (field, size) in enumerate(_STRING_FIELDS):
+            value = getattr(client, f"get_{field}")()
+            if value is None:
+                null_mask |= 1 << i
+                strings.append(b"")
+                continue
+            raw = value.encode("utf-8")
+            if len(raw) > size:
+                raise ValueError(f"Поле {field} не помещается в запись (максимум {size} байт в UTF-8)")
+            strings.append(raw)
+        return null_mask, strings
+
+    def _write_record(self, record: int, client: Client):
+        """Запись клиента на место записи record"""
+        offset = self._record_offset(record)
+        self._mmap[offset : offset + _RECORD.size] = self._pack_client(client)
+
+    def _allocate_record(self) -> int:
+        """Новая запись в конце файла (при нехватке места файл увеличивается вдвое)"""
+        record = self._record_count
+        capacity = (len(self._mmap) - _HEADER.size) // _RECORD.size
+        if record >= capacity:
+            self._mmap.flush()
+            self._mmap.close()
+            self._file.truncate(self._record_offset(max(16, capacity * 2)))
+            self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._record_count = record + 1
+        self._mmap[: _HEADER.size] = _HEADER.pack(_MAGIC, _FORMAT_VERSION, _RECORD.size, self._record_count)
+        return record
+
+    def _free_record(self, record: int):
+        """Пометка записи как удаленной"""
+        self._mmap[self._record_offset(record)] = 0
+        self._holes += 1
+
+    def add_client(self, client: Client) -> Client:
+        # Проверка длины полей до изменения состояния репозитория
+        self._pack_strings(client)
+        return super().add_client(client)
+
+    def replace_by_id(self, client_id: int, new_client: Client) -> bool:
+        self._pack_strings(new_client)
+        return super().replace_by_id(client_id, new_client)
+
+    def write_all(self):
+        """b. Запись всех значений в файл подряд в текущем порядке (компактизация удаленных записей)"""
+        slots = self._clients.slots
+        data = self._mmap
+
+        def dump(f):
+            f.write(_HEADER.pack(_MAGIC, _FORMAT_VERSION, _RECORD.size, len(slots)))
+            for record in slots:
+                offset = self._record_offset(record)
+                f.write(data[offset : offset + _RECORD.size])
+
+        self._atomic_write(dump, binary=True, before_replace=self._close_map)
+        self._open_map()
+        self._holes = 0
+        # Порядок и ID не меняются, но записи получили новые номера - кэши по списку устарели
+        self._clients = _BinaryClientList(self, list(range(len(slots))))
+        self._version += 1
+
+    def compact(self):
+        """Компактизация: перезапись файла без удаленных записей"""
+        with self._lock:
+            self.write_all()
+
+    def _write_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Запись уже выполнена на месте - сбрасываем измененные страницы на диск"""
+        self._flush_changes()
+
+    def _flush_changes(self):
+        if self._holes > max(len(self._clients), _MIN_COMPACT_HOLES):
+            self.write_all()
+        else:
+            self._mmap.flush()
+
+    def close(self):
+        """Сохранение изменений и закрытие отображения файла"""
+        super().close()
+        self._close_map()
+
+    def sort_by_field(self, reverse: bool = False):
+        """Переопределение абстрактного метода - сортировка по фамилии"""
+        self.sort_by_surname(reverse)
+
+    def sort_by_surname(self, reverse: bool = False):
+        """
+        e. Сортировать элементы по выбранному полю (surname/фамилия)
+
+        Args:
+            reverse: Если True, сортировка в обратном порядке
+        """
+        self._sort_clients(lambda client: client.get_surname() if client.get_surname() else "", reverse)
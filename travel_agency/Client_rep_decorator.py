@@ -1,8 +1,15 @@
+import heapq
 from abc import ABC, abstractmethod
-from typing import Callable, List, Optional
+from operator import itemgetter
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from travel_agency.Client import Client
-from travel_agency.Client_rep_base import Client_rep_base
+from travel_agency.Client_rep_base import Client_rep_base, ClientListView, decode_page_cursor, encode_page_cursor
+
+try:
+    from travel_agency.ClientFrame import ClientFrame
+except ImportError:  # NumPy не установлен - работают только построчные фильтры
+    ClientFrame = None
 
 
 class ClientFilter(ABC):
@@ -13,6 +20,15 @@ class ClientFilter(ABC):
         """Применить фильтр к списку клиентов"""
         pass
 
+    def mask(self, frame: "ClientFrame"):
+        """
+        Векторный вариант фильтра по колоночному хранилищу.
+
+        Returns:
+            Булев массив NumPy или None, если фильтр не поддерживает векторный режим
+        """
+        return None
+
 
 class BalanceFilter(ClientFilter):
     """Фильтр по балансу"""
@@ -29,6 +45,18 @@ class BalanceFilter(ClientFilter):
             result = [c for c in result if c.get_balance() and c.get_balance() <= self.max_balance]
         return result
 
+    def mask(self, frame: "ClientFrame"):
+        result = frame.all_rows()
+        if self.min_balance is None and self.max_balance is None:
+            return result
+        # Как и в apply: пустой и нулевой баланс не проходят фильтр
+        result &= ~frame.balance_null & (frame.balance != 0)
+        if self.min_balance is not None:
+            result &= frame.balance >= self.min_balance
+        if self.max_balance is not None:
+            result &= frame.balance <= self.max_balance
+        return result
+
 
 class EmailFilter(ClientFilter):
     """Фильтр по наличию email"""
@@ -42,6 +70,10 @@ class EmailFilter(ClientFilter):
         else:
             return [c for c in clients if not c.get_email()]
 
+    def mask(self, frame: "ClientFrame"):
+        has_email = frame.email.category_mask(bool)
+        return has_email if self.has_email else ~has_email
+
 
 class SurnameFilter(ClientFilter):
     """Фильтр по фамилии (начинается с)"""
@@ -52,13 +84,20 @@ class SurnameFilter(ClientFilter):
     def apply(self, clients: List[Client]) -> List[Client]:
         return [c for c in clients if c.get_surname().lower().startswith(self.starts_with)]
 
+    def mask(self, frame: "ClientFrame"):
+        return frame.surname.category_mask(lambda surname: surname.lower().startswith(self.starts_with))
+
 
 class SortStrategy:
-    """Стратегия сортировки с ключом и направлением"""
+    """
+    Стратегия сортировки с ключом и направлением.
+    column - имя колонки ClientFrame для векторной сортировки (None - только построчная).
+    """
 
-    def __init__(self, key_func: Callable, reverse: bool = False):
+    def __init__(self, key_func: Callable, reverse: bool = False, column: Optional[str] = None):
         self.key_func = key_func
         self.reverse = reverse
+        self.column = column
 
 
 class ClientSorter:
@@ -67,17 +106,17 @@ class ClientSorter:
     @staticmethod
     def by_surname(reverse: bool = False) -> SortStrategy:
         """Сортировка по фамилии"""
-        return SortStrategy(lambda c: c.get_surname() or "", reverse)
+        return SortStrategy(lambda c: c.get_surname() or "", reverse, "surname")
 
     @staticmethod
     def by_balance(reverse: bool = False) -> SortStrategy:
         """Сортировка по балансу"""
-        return SortStrategy(lambda c: c.get_balance() or 0, reverse)
+        return SortStrategy(lambda c: c.get_balance() or 0, reverse, "balance")
 
     @staticmethod
     def by_email(reverse: bool = False) -> SortStrategy:
         """Сортировка по email"""
-        return SortStrategy(lambda c: c.get_email() or "", reverse)
+        return SortStrategy(lambda c: c.get_email() or "", reverse, "email")
 
 
 class Client_rep_decorator(Client_rep_base):
@@ -95,7 +134,7 @@ class Client_rep_decorator(Client_rep_base):
         """
         self._repository = repository
         self.file_path = repository.file_path
-        self._clients = []
+        self._init_state()
         self._filters: List[ClientFilter] = []
         self._sorter: Optional[SortStrategy] = None
 
@@ -115,8 +154,8 @@ class Client_rep_decorator(Client_rep_base):
         """Очистить сортировку"""
         self._sorter = None
 
-    def _apply_filters_and_sorting(self, clients: List[Client]) -> List[Client]:
-        """Применить фильтры и сортировку"""
+    def _apply_filters_and_sorting(self, clients: Iterable[Client]) -> Iterable[Client]:
+        """Применить фильтры и сортировку (без фильтров и сортировки clients возвращается как есть)"""
         result = clients
 
         # Применение фильтров
@@ -129,27 +168,101 @@ class Client_rep_decorator(Client_rep_base):
 
         return result
 
+    def _select_rows(self):
+        """
+        Векторный отбор и сортировка номеров строк по ClientFrame декорируемого репозитория.
+
+        Returns:
+            Пара (frame, номера строк) или None, если векторный режим недоступен
+            (нет NumPy, пользовательский фильтр или сортировка без колонки)
+        """
+        if ClientFrame is None or (self._sorter and self._sorter.column is None):
+            return None
+
+        frame = self._repository.get_frame()
+        selected = frame.all_rows()
+        for filter in self._filters:
+            filter_mask = filter.mask(frame)
+            if filter_mask is None:
+                return None
+            selected &= filter_mask
+
+        rows = selected.nonzero()[0]
+        if self._sorter:
+            rows = frame.argsort(self._sorter.column, self._sorter.reverse, rows)
+        return frame, rows
+
+    def get_frame(self):
+        """Колоночное представление с учетом фильтров и сортировки декоратора"""
+        return ClientFrame(self.read_all())
+
     def _load_from_file(self):
         """Делегирование загрузки декорируемому объекту"""
-        self._repository._load_from_file()
+        self._repository.reload_from_file()
         self._clients = self._repository._clients
 
-    def reload_from_file(self):
+    def reload_from_file(self, force: bool = False):
         """Делегирование перезагрузки декорируемому объекту"""
-        self._repository.reload_from_file()
+        return self._repository.reload_from_file(force)
 
     def write_all(self):
         """Делегирование записи декорируемому объекту"""
         self._repository.write_all()
 
+    def batch(self):
+        """Делегирование пакетного режима декорируемому объекту"""
+        return self._repository.batch()
+
+    def flush(self):
+        """Делегирование сброса изменений декорируемому объекту"""
+        self._repository.flush()
+
+    def enable_write_behind(self, interval: float = 1.0, max_dirty: int = 100):
+        """Делегирование включения фоновой записи декорируемому объекту"""
+        self._repository.enable_write_behind(interval, max_dirty)
+
+    def enable_copy_on_write(self):
+        """Делегирование включения режима копирования при записи декорируемому объекту"""
+        self._repository.enable_copy_on_write()
+
+    def close(self):
+        """Делегирование закрытия декорируемому объекту"""
+        self._repository.close()
+
     def sort_by_field(self, reverse: bool = False):
         """Делегирование сортировки декорируемому объекту"""
         self._repository.sort_by_field(reverse)
 
+    def _is_passthrough(self) -> bool:
+        """Нет ни фильтров, ни сортировки - данные декорируемого объекта используются как есть"""
+        return not self._filters and self._sorter is None
+
     def read_all(self) -> List[Client]:
         """Чтение всех клиентов с применением фильтров и сортировки"""
-        clients = self._repository.read_all()
-        return self._apply_filters_and_sorting(clients)
+        selection = self._select_rows()
+        if selection is not None:
+            frame, rows = selection
+            return frame.take(rows)
+
+        return list(self._apply_filters_and_sorting(self._repository.view()))
+
+    def iter_all(self) -> Iterator[Client]:
+        """Обход клиентов с применением фильтров и сортировки (объекты Client создаются по мере обхода)"""
+        if self._is_passthrough():
+            return self._repository.iter_all()
+
+        selection = self._select_rows()
+        if selection is not None:
+            frame, rows = selection
+            return (frame.client_at(int(row)) for row in rows)
+
+        return iter(self._apply_filters_and_sorting(self._repository.view()))
+
+    def view(self) -> ClientListView:
+        """Клиенты с учетом фильтров и сортировки в виде последовательности только для чтения"""
+        if self._is_passthrough():
+            return self._repository.view()
+        return ClientListView(self.read_all())
 
     def get_by_id(self, client_id: int) -> Optional[Client]:
         """Делегирование получения по ID"""
@@ -166,22 +279,89 @@ class Client_rep_decorator(Client_rep_base):
         Returns:
             Список кортежей
         """
-        # Получаем все записи
-        all_clients = self._repository.read_all()
+        if self._is_passthrough():
+            return self._repository.get_k_n_short_list(k, n)
 
-        # Применяем фильтры и сортировку
-        filtered_clients = self._apply_filters_and_sorting(all_clients)
-
-        # Применяем пагинацию
         start_index = (k - 1) * n
         end_index = start_index + n
 
+        # Векторный режим: объекты Client создаются только для нужной страницы
+        selection = self._select_rows()
+        if selection is not None:
+            frame, rows = selection
+            return [client.short_information for client in frame.take(rows[start_index:end_index])]
+
+        # Применяем фильтры и сортировку к представлению данных (без копирования всех записей)
+        filtered_clients = self._apply_filters_and_sorting(self._repository.view())
+
+        # Применяем пагинацию
         if start_index >= len(filtered_clients):
             return []
 
         page_clients = filtered_clients[start_index:end_index]
         return [client.short_information for client in page_clients]
 
+    def get_page_after(
+        self, cursor: Optional[str] = None, n: int = 20, order: str = "id"
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        Постраничный вывод по курсору с учетом фильтров. Порядок страниц задается параметром order,
+        сортировка декоратора не применяется (курсор опирается на ключ порядка).
+        Без фильтров вызов делегируется декорируемому объекту.
+
+        Args:
+            cursor: Курсор из предыдущего вызова (None - первая страница)
+            n: Количество элементов на странице
+            order: Порядок страниц: "id" или "surname" (фамилия, затем ID)
+
+        Returns:
+            Пара (список кортежей с краткой информацией, курсор следующей страницы или None для последней)
+        """
+        if not self._filters:
+            return self._repository.get_page_after(cursor, n, order)
+
+        after = decode_page_cursor(cursor, order)
+        clients = self._repository.view()
+        for filter in self._filters:
+            clients = filter.apply(clients)
+
+        keyed = ((self._page_key(self._page_values(order, client)), client) for client in clients)
+        if after is not None:
+            after_key = self._page_key(after)
+            keyed = (item for item in keyed if item[0] > after_key)
+        # Частичный отбор n + 1 наименьших ключей вместо сортировки всех подходящих клиентов
+        page = [client for _, client in heapq.nsmallest(n + 1, keyed, key=itemgetter(0))]
+
+        next_cursor = None
+        if len(page) > n:
+            page = page[:n]
+            next_cursor = encode_page_cursor(order, self._page_values(order, page[-1]))
+        return [client.short_information for client in page], next_cursor
+
+    def find_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> List[Client]:
+        """Делегирование поиска по ФИО и дате рождения"""
+        return self._repository.find_by_identity(surname, firstname, fathers_name, birth_date)
+
+    def is_client_unique(self, client: Client) -> bool:
+        """Делегирование проверки уникальности"""
+        return self._repository.is_client_unique(client)
+
+    def delete_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> bool:
+        """Делегирование удаления по ФИО и дате рождения"""
+        return self._repository.delete_by_identity(surname, firstname, fathers_name, birth_date)
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Делегирование поиска по email"""
+        return self._repository.find_by_email(email)
+
+    def find_by_phone(self, phone_number: str) -> Optional[Client]:
+        """Делегирование поиска по телефону"""
+        return self._repository.find_by_phone(phone_number)
+
+    def find_by_passport(self, pasport: str) -> Optional[Client]:
+        """Делегирование поиска по паспорту"""
+        return self._repository.find_by_passport(pasport)
+
     def add_client(self, client: Client) -> Client:
         """Делегирование добавления"""
         return self._repository.add_client(client)
@@ -201,6 +381,12 @@ class Client_rep_decorator(Client_rep_base):
         Returns:
             Количество клиентов после применения фильтров
         """
-        all_clients = self._repository.read_all()
-        filtered_clients = self._apply_filters_and_sorting(all_clients)
+        if not self._filters:
+            return self._repository.get_count()
+
+        selection = self._select_rows()
+        if selection is not None:
+            return len(selection[1])
+
+        filtered_clients = self._apply_filters_and_sorting(self._repository.view())
         return len(filtered_clients)
@@ -1,49 +1,167 @@
 import json
 import os
+from typing import Any, Callable, List, Optional
 
 from travel_agency.Client import Client
 from travel_agency.Client_rep_base import Client_rep_base
 
+# Размер журнала по умолчанию, после которого выполняется компактизация
+_JOURNAL_MAX_BYTES = 1024 * 1024
+
 
 class Client_rep_json(Client_rep_base):
     """
     Класс для работы с данными клиентов в формате JSON.
     Обеспечивает чтение, запись, поиск, сортировку и управление объектами Client.
     Наследуется от Client_rep_base.
+
+    В журналируемом режиме (journaled=True) каждое изменение дописывается одной строкой
+    в файл-журнал рядом с основным файлом, а полная перезапись (компактизация)
+    выполняется только когда журнал превышает journal_max_bytes.
+
+    Повторное создание репозитория для того же файла возвращает общий экземпляр.
+    Незаданные (None) параметры берутся у него, заданные должны с ним совпадать.
     """
 
+    _shared_by_path = True
+
+    def __init__(
+        self,
+        file_path: str,
+        journaled: Optional[bool] = None,
+        journal_max_bytes: Optional[int] = None,
+        snapshot: Optional[bool] = None,
+    ):
+        """
+        Инициализация репозитория.
+
+        Args:
+            file_path: Путь к файлу для хранения данных
+            journaled: Если True, изменения дописываются в журнал вместо перезаписи файла (по умолчанию False)
+            journal_max_bytes: Размер журнала в байтах, после которого выполняется компактизация (по умолчанию 1 МБ)
+            snapshot: Если True, разобранные данные кэшируются в двоичном снимке рядом с файлом (по умолчанию False)
+
+        Raises:
+            ValueError: Если файл уже открыт с другими параметрами
+        """
+        if self._reuse_shared(journaled=journaled, journal_max_bytes=journal_max_bytes, snapshot=snapshot):
+            return
+        self.snapshot = bool(snapshot)
+        self.journaled = bool(journaled)
+        self.journal_max_bytes = _JOURNAL_MAX_BYTES if journal_max_bytes is None else journal_max_bytes
+        self.journal_path = file_path + ".journal"
+        super().__init__(file_path)
+
+    def _read_file_items(self) -> Optional[List[dict]]:
+        """Записи основного файла (None, если файла нет или он поврежден)"""
+        if not os.path.exists(self.file_path):
+            return None
+        try:
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, FileNotFoundError):
+            return None
+
     def _load_from_file(self):
-        """Чтение всех значений из файла"""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self._clients = [Client.from_json(json.dumps(item, ensure_ascii=False)) for item in data]
-            except (json.JSONDecodeError, FileNotFoundError):
-                self._clients = []
-        else:
-            self._clients = []
+        """Чтение всех значений из файла (основной файл или его двоичный снимок + изменения из журнала)"""
+        clients = self._load_snapshot()
+        if clients is None:
+            items = self._read_file_items()
+            clients = [Client.from_trusted(**item) for item in items or []]
+            if items is not None:
+                self._save_snapshot(clients)
+        clients_by_id = self._replay_journal({client.get_id(): client for client in clients})
+        self._clients = [
+            value if isinstance(value, Client) else self._dict_to_client(value) for value in clients_by_id.values()
+        ]
+        self._record_hashes = None
+
+    def _read_items(self) -> Optional[List[dict]]:
+        """Записи основного файла с примененным журналом (для пословной перезагрузки)"""
+        items = self._read_file_items() or []
+        if any(item.get("id") is None for item in items):
+            # Записям без ID при загрузке выдаются новые ID - сопоставить их можно только полной загрузкой
+            return None
+        items_by_id = {item["id"]: item for item in items}
+        return list(self._replay_journal(items_by_id).values())
+
+    def _replay_journal(self, clients_by_id: dict) -> dict:
+        """
+        Применение записей журнала к загруженному снимку.
+
+        Args:
+            clients_by_id: Упорядоченный словарь ID -> клиент (или запись) из основного файла
+
+        Returns:
+            Тот же словарь с учетом всех изменений из журнала (измененные клиенты - словарями полей)
+        """
+        if not os.path.exists(self.journal_path):
+            return clients_by_id
+
+        with open(self.journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Оборванная при сбое последняя запись - дальше читать нечего
+                    break
+
+                if entry["op"] == "delete":
+                    clients_by_id.pop(entry["id"], None)
+                else:
+                    clients_by_id[entry["id"]] = entry["client"]
+        return clients_by_id
+
+    def _source_paths(self) -> List[str]:
+        return [self.file_path, self.journal_path]
+
+    def _dict_to_client(self, data: dict) -> Client:
+        """Преобразование словаря из собственного файла в объект Client (без повторной валидации)"""
+        return Client.from_trusted(**data)
 
     def write_all(self):
-        """b. Запись всех значений в файл"""
-        data = []
-        for client in self._clients:
-            birth_date_str = client.get_birth_date().strftime("%d.%m.%Y") if client.get_birth_date() else None
-            client_data = {
-                "id": client.get_id(),
-                "surname": client.get_surname(),
-                "firstname": client.get_firstname(),
-                "fathers_name": client.get_fathers_name(),
-                "birth_date": birth_date_str,
-                "phone_number": client.get_phone_number(),
-                "pasport": client.get_pasport(),
-                "email": client.get_email(),
-                "balance": client.get_balance(),
-            }
-            data.append(client_data)
-
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        """b. Запись всех значений в файл (журнал после этого не нужен и удаляется)"""
+        self._write_clients(self._clients)
+
+    def _write_clients(self, clients: List[Client]):
+        """Запись списка клиентов в основной файл и удаление журнала"""
+        with self._write_lock:
+            data = [self._client_to_dict(client) for client in clients]
+
+            self._atomic_write(lambda f: json.dump(data, f, ensure_ascii=False, indent=2))
+            self._save_snapshot(clients)
+
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+
+    def _snapshot_changes(self) -> Optional[Callable[[], None]]:
+        """Копия списка (только ссылки на неизменяемые клиенты) - сериализация и запись вне блокировки"""
+        clients = list(self._clients)
+        return lambda: self._write_clients(clients)
+
+    def _write_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Дописывание изменения в журнал (или полная перезапись, если журнал выключен)"""
+        if not self.journaled:
+            self.write_all()
+            return
+
+        entry = {"op": operation, "id": client_id}
+        if client is not None:
+            entry["client"] = self._client_to_dict(client)
+
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            journal_size = f.tell()
+
+        if journal_size >= self.journal_max_bytes:
+            self.compact()
+
+    def compact(self):
+        """Компактизация: запись текущего состояния в основной файл и очистка журнала"""
+        self.write_all()
 
     def sort_by_field(self, reverse: bool = False):
         """Переопределение абстрактного метода - сортировка по email"""
@@ -56,4 +174,4 @@ class Client_rep_json(Client_rep_base):
         Args:
             reverse: Если True, сортировка в обратном порядке
         """
-        self._clients.sort(key=lambda client: client.get_email() if client.get_email() else "", reverse=reverse)
+        self._sort_clients(lambda client: client.get_email() if client.get_email() else "", reverse)
@@ -0,0 +1,270 @@
+import json
+import mmap
+import os
+import re
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from typing import Any, Callable, Iterator, List, Optional, Union
+
+from travel_agency.Client import Client
+from travel_agency.Client_rep_json import Client_rep_json
+
+# Элемент массива: плоский объект JSON (записи клиентов не содержат вложенных объектов, строки могут
+# содержать скобки) и следующий за ним разделитель. Выражение записано "развернутым циклом": текст
+# между строками и внутри строк делится на части единственным образом, поэтому возврат линеен
+# и на оборванных или поврежденных записях (без притяжательных квантификаторов Python 3.11)
+_ITEM_PATTERN = re.compile(rb'\s*(\{[^{}"]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^{}"]*)*\})\s*([,\]])')
+_ARRAY_START = re.compile(rb"\s*\[")
+_EMPTY_ARRAY = re.compile(rb"\s*\]")
+_END = re.compile(rb"\s*\Z")
+
+_ID_PATTERN = re.compile(rb'"id"\s*:\s*(?:(-?\d+)|("(?:[^"\\]|\\.)*"|null))')
+
+
+class _LazyClientList(MutableSequence):
+    """
+    Список клиентов для ленивого репозитория. Элемент хранится либо как номер записи
+    в файле (int), либо как объект Client (новый или измененный клиент, которого еще нет в файле).
+    Записи из файла превращаются в Client только при обращении и держатся в LRU-кэше ограниченного размера.
+    """
+
+    def __init__(self, slots: List[Union[int, Client]], load: Callable[[int], Client], cache_size: int):
+        self._slots = slots
+        self._load = load
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[int, Client]" = OrderedDict()
+
+    def _resolve(self, slot: Union[int, Client], remember: bool = True) -> Client:
+        """Получение объекта Client для элемента списка (с LRU-кэшем для записей из файла)"""
+        if not isinstance(slot, int):
+            return slot
+        client = self._cache.get(slot)
+        if client is not None:
+            self._cache.move_to_end(slot)
+            return client
+        client = self._load(slot)
+        if remember:
+            self._cache[slot] = client
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return client
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._resolve(slot) for slot in self._slots[i]]
+        return self._resolve(self._slots[i])
+
+    def __setitem__(self, i, client: Client):
+        self._slots[i] = client
+
+    def __delitem__(self, i):
+        del self._slots[i]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __iter__(self) -> Iterator[Client]:
+        # Полный обход не вытесняет из кэша рабочий набор
+        for slot in self._slots:
+            yield self._resolve(slot, remember=False)
+
+    def insert(self, i: int, client: Client):
+        self._slots.insert(i, client)
+
+    def copy(self) -> List[Client]:
+        return list(self)
+
+    def sort(self, key: Callable[[Client], Any], reverse: bool = False):
+        self._slots.sort(key=lambda slot: key(self._resolve(slot, remember=False)), reverse=reverse)
+
+    @property
+    def slots(self) -> List[Union[int, Client]]:
+        return self._slots
+
+    def clear_cache(self):
+        self._cache.clear()
+
+
+class Client_rep_json_lazy(Client_rep_json):
+    """
+    Ленивый репозиторий JSON для очень больших файлов.
+    При загрузке один раз строится индекс байтовых смещений записей (без создания объектов Client),
+    клиенты создаются по требованию и хранятся в LRU-кэше не более cache_size штук.
+    Страницы get_k_n_short_list читают из файла только нужные записи.
+
+    Note:
+        read_all(), сортировка и get_frame() по-прежнему требуют обхода всех записей.
+        Первый поиск по email/телефону/паспорту/ФИО обходит все записи для построения индекса,
+        индекс хранит только ключи и ID, а найденные клиенты загружаются через LRU-кэш.
+    """
+
+    # Каждый экземпляр держит собственное отображение файла и кэш
+    _shared_by_path = False
+    # LRU-кэш изменяется при каждом чтении
+    _supports_copy_on_write = False
+    # Индексы поиска хранят только ID: найденные клиенты загружаются через LRU-кэш
+    _index_by_id = True
+
+    def __init__(
+        self,
+        file_path: str,
+        cache_size: int = 10000,
+        journaled: bool = False,
+        journal_max_bytes: int = 1024 * 1024,
+    ):
+        """
+        Args:
+            file_path: Путь к файлу JSON
+            cache_size: Максимальное количество клиентов в памяти (LRU)
+            journaled: Если True, изменения дописываются в журнал вместо перезаписи файла
+            journal_max_bytes: Размер журнала, после которого выполняется компактизация
+        """
+        self.cache_size = cache_size
+        self._file = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._starts: List[int] = []
+        self._ends: List[int] = []
+        self._record_ids: List[Any] = []
+        super().__init__(file_path, journaled=journaled, journal_max_bytes=journal_max_bytes)
+
+    def _open_map(self):
+        """Открытие файла и отображение его в память (пустой или отсутствующий файл - без отображения)"""
+        self._close_map()
+        if not os.path.exists(self.file_path) or os.path.getsize(self.file_path) == 0:
+            return
+        self._file = open(self.file_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close_map(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _scan_offsets(self) -> bool:
+        """
+        Построение индекса смещений [start, end) и ID записей верхнего уровня массива
+        за один проход по файлу.
+
+        Returns:
+            False, если файл не является массивом плоских объектов (поврежден или записан иначе)
+        """
+        starts, ends = [], []
+        self._starts, self._ends, self._record_ids = starts, ends, []
+        data = self._mmap
+        if data is None:
+            return True
+
+        match = _ARRAY_START.match(data)
+        if match is None:
+            return False
+        position = match.end()
+        match = _EMPTY_ARRAY.match(data, position)
+        if match is None:
+            while True:
+                match = _ITEM_PATTERN.match(data, position)
+                if match is None:
+                    return False
+                start, end = match.span(1)
+                starts.append(start)
+                ends.append(end)
+                position = match.end()
+                if match.group(2) == b"]":
+                    break
+        else:
+            position = match.end()
+        if _END.match(data, position) is None:
+            return False
+
+        self._record_ids = [self._record_id(start, end) for start, end in zip(starts, ends)]
+        return True
+
+    def _record_id(self, start: int, end: int) -> Any:
+        """ID записи без разбора всего объекта"""
+        match = _ID_PATTERN.search(self._mmap, start, end)
+        if match is None:
+            return None
+        number, other = match.groups()
+        return int(number) if number else json.loads(other)
+
+    def _load_record(self, record: int) -> Client:
+        """Создание объекта Client из записи файла с номером record"""
+        item = json.loads(self._mmap[self._starts[record] : self._ends[record]])
+        return Client.from_trusted(**item)
+
+    def _load_from_file(self):
+        """Построение индекса смещений и применение журнала без создания всех объектов Client"""
+        self._open_map()
+        if self._scan_offsets() and None not in self._record_ids:
+            slots_by_id = self._replay_journal(dict(zip(self._record_ids, range(len(self._record_ids)))))
+        else:
+            # Формат не распознан сканером или у записей нет ID - полное чтение, как в Client_rep_json
+            # (записи хранятся объектами, недостающие ID выдаются при создании)
+            clients = [self._dict_to_client(item) for item in self._read_file_items() or []]
+            slots_by_id = self._replay_journal({client.get_id(): client for client in clients})
+        slots = [
+            slot if isinstance(slot, (int, Client)) else self._dict_to_client(slot) for slot in slots_by_id.values()
+        ]
+        self._clients = _LazyClientList(slots, self._load_record, self.cache_size)
+
+    def _read_items(self) -> None:
+        """Пословная перезагрузка не используется: она потребовала бы держать в памяти все записи"""
+        return None
+
+    def _iter_client_ids(self) -> Iterator[Any]:
+        record_ids = self._record_ids
+        return (record_ids[slot] if isinstance(slot, int) else slot.get_id() for slot in self._clients.slots)
+
+    def _client_id_at(self, position: int) -> Any:
+        slot = self._clients.slots[position]
+        return self._record_ids[slot] if isinstance(slot, int) else slot.get_id()
+
+    def _record_text(self, client: Client) -> bytes:
+        """Запись клиента в том же виде, что и Client_rep_json.write_all (элемент массива с indent=2)"""
+        text = json.dumps(self._client_to_dict(client), ensure_ascii=False, indent=2)
+        return text.replace("\n", "\n  ").encode("utf-8")
+
+    def _snapshot_changes(self) -> None:
+        """Запись переключает отображение файла - выполняется под блокировкой"""
+        return None
+
+    def write_all(self):
+        """
+        b. Запись всех значений в файл.
+        Неизмененные записи копируются из старого файла байт в байт, без разбора JSON.
+        """
+        slots = self._clients.slots
+        starts, ends, record_ids = [], [], []
+
+        def dump(f):
+            position = f.write(b"[")
+            for i, slot in enumerate(slots):
+                position += f.write(b"\n  " if i == 0 else b",\n  ")
+                if isinstance(slot, int):
+                    record = self._mmap[self._starts[slot] : self._ends[slot]]
+                    record_ids.append(self._record_ids[slot])
+                else:
+                    record = self._record_text(slot)
+                    record_ids.append(slot.get_id())
+                starts.append(position)
+                position += f.write(record)
+                ends.append(position)
+            f.write(b"\n]" if slots else b"]")
+
+        self._atomic_write(dump, binary=True, before_replace=self._close_map)
+
+        # Все клиенты теперь лежат в новом файле - переключаемся на него
+        self._open_map()
+        self._starts, self._ends, self._record_ids = starts, ends, record_ids
+        self._clients = _LazyClientList(list(range(len(starts))), self._load_record, self.cache_size)
+        self._rebuild_index()
+
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def close(self):
+        """Сохранение изменений и закрытие отображения файла"""
+        super().close()
+        self._close_map()
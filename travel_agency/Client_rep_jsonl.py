@@ -0,0 +1,127 @@
+import json
+import os
+from typing import Any, List, Optional
+
+from travel_agency.Client import Client
+from travel_agency.Client_rep_base import Client_rep_base
+
+# Ключ строки-надгробия: клиент с этим ID удален
+_DELETED_KEY = "deleted"
+
+
+class Client_rep_jsonl(Client_rep_base):
+    """
+    Класс для работы с данными клиентов в формате JSON Lines (один клиент на строку).
+    Наследуется от Client_rep_base.
+
+    Добавление дописывает в конец файла одну строку. Замена дописывает новую версию клиента
+    (при чтении побеждает последняя строка с данным ID), удаление - строку-надгробие {"id": ..., "deleted": true}.
+    Устаревшие строки убираются компактизацией (полной перезаписью файла), когда их становится
+    больше чем compact_ratio * количество клиентов (но не меньше min_compact_lines).
+    """
+
+    def __init__(self, file_path: str, compact_ratio: float = 1.0, min_compact_lines: int = 1000):
+        """
+        Инициализация репозитория.
+
+        Args:
+            file_path: Путь к файлу для хранения данных
+            compact_ratio: Допустимая доля устаревших строк относительно числа клиентов
+            min_compact_lines: Минимальное количество устаревших строк для компактизации
+        """
+        self.compact_ratio = compact_ratio
+        self.min_compact_lines = min_compact_lines
+        self._stale_lines = 0
+        self._pending_lines: List[str] = []
+        self._needs_newline = False
+        super().__init__(file_path)
+
+    def _load_from_file(self):
+        """Потоковое чтение файла построчно с применением замен и надгробий"""
+        clients_by_id = {}
+        line_count = 0
+        self._pending_lines = []
+        self._needs_newline = False
+        if os.path.exists(self.file_path):
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    # Последняя строка без перевода строки (оборванная запись) -
+                    # следующая запись начнется с новой строки
+                    self._needs_newline = not line.endswith("\n")
+                    if not line.strip():
+                        continue
+                    try:
+                        item = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+
+                    line_count += 1
+                    if item.get(_DELETED_KEY):
+                        clients_by_id.pop(item["id"], None)
+                    else:
+                        client = Client.from_trusted(**item)
+                        clients_by_id[client.get_id()] = client
+        self._clients = list(clients_by_id.values())
+        self._stale_lines = line_count - len(self._clients)
+
+    def _client_to_line(self, client: Client) -> str:
+        return json.dumps(self._client_to_dict(client), ensure_ascii=False)
+
+    def write_all(self):
+        """b. Запись всех значений в файл (компактизация: по одной строке на клиента)"""
+        lines = [self._client_to_line(client) for client in self._clients]
+
+        self._atomic_write(lambda f: f.writelines(line + "\n" for line in lines))
+
+        self._stale_lines = 0
+        self._pending_lines = []
+        self._needs_newline = False
+
+    def compact(self):
+        """Компактизация: перезапись файла без устаревших строк и надгробий"""
+        with self._lock:
+            self.write_all()
+
+    def _persist_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Подготовка строки изменения; дописывается сразу или при flush() (пакет, фоновая запись)"""
+        if operation == "delete":
+            self._pending_lines.append(json.dumps({"id": client_id, _DELETED_KEY: True}, ensure_ascii=False))
+            # Устаревают прежняя строка клиента и само надгробие
+            self._stale_lines += 2
+        else:
+            self._pending_lines.append(self._client_to_line(client))
+            if operation == "replace":
+                self._stale_lines += 1
+        super()._persist_change(operation, client_id, client)
+
+    def _write_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Дописывание одной строки в конец файла"""
+        self._flush_changes()
+
+    def _flush_changes(self):
+        """Дописывание накопленных строк одной записью или компактизация, если устаревших строк слишком много"""
+        if self._stale_lines > max(len(self._clients) * self.compact_ratio, self.min_compact_lines):
+            self.write_all()
+            return
+
+        lines, self._pending_lines = self._pending_lines, []
+        if not lines:
+            return
+        with open(self.file_path, "a", encoding="utf-8") as f:
+            if self._needs_newline:
+                f.write("\n")
+                self._needs_newline = False
+            f.write("".join(line + "\n" for line in lines))
+
+    def sort_by_field(self, reverse: bool = False):
+        """Переопределение абстрактного метода - сортировка по email"""
+        self.sort_by_email(reverse)
+
+    def sort_by_email(self, reverse: bool = False):
+        """
+        e. Сортировать элементы по выбранному полю (email)
+
+        Args:
+            reverse: Если True, сортировка в обратном порядке
+        """
+        self._sort_clients(lambda client: client.get_email() if client.get_email() else "", reverse)
@@ -0,0 +1,411 @@
+import sqlite3
+from datetime import date
+from typing import Any, Iterator, List, Optional, Tuple
+
+from travel_agency.Client import Client
+from travel_agency.Client_rep_base import (
+    PAGE_ORDERS,
+    Client_rep_base,
+    ClientListView,
+    ReloadDiff,
+    decode_page_cursor,
+    encode_page_cursor,
+)
+
+# Нормализованные ключи (*_key) вычисляются в Python функциями Client.normalize_* и make_identity_key,
+# так как lower() в SQLite не работает с кириллицей
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS clients (
+        id INTEGER PRIMARY KEY,
+        surname TEXT NOT NULL,
+        firstname TEXT NOT NULL,
+        fathers_name TEXT,
+        birth_date TEXT,
+        phone_number TEXT,
+        pasport TEXT,
+        email TEXT,
+        balance REAL,
+        surname_key TEXT,
+        firstname_key TEXT,
+        email_key TEXT,
+        phone_key TEXT,
+        pasport_key TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_clients_surname ON clients(surname);
+    CREATE INDEX IF NOT EXISTS idx_clients_email ON clients(email_key);
+    CREATE INDEX IF NOT EXISTS idx_clients_birth_date ON clients(birth_date);
+    CREATE INDEX IF NOT EXISTS idx_clients_identity ON clients(surname_key, firstname_key, birth_date);
+    CREATE INDEX IF NOT EXISTS idx_clients_phone ON clients(phone_key);
+    CREATE INDEX IF NOT EXISTS idx_clients_pasport ON clients(pasport_key);
+"""
+
+_COLUMNS = "id, surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance"
+_SHORT_COLUMNS = "id, surname, firstname, fathers_name, birth_date, email"
+# Количество строк, читаемых из курсора за один раз в iter_all
+_FETCH_SIZE = 1000
+_DATA_COLUMNS = (
+    "surname, firstname, fathers_name, birth_date, phone_number, pasport, email, balance, "
+    "surname_key, firstname_key, email_key, phone_key, pasport_key"
+)
+
+
+class Client_rep_sqlite(Client_rep_base):
+    """
+    Класс для работы с данными клиентов во встроенной базе SQLite (один файл, сервер не нужен).
+    Наследуется от Client_rep_base.
+
+    Данные не загружаются в память: поиск, сортировка, постраничный вывод и подсчет
+    выполняются запросами по индексам. База работает в режиме WAL, каждое изменение
+    фиксируется отдельной транзакцией, а внутри batch() (и при фоновой записи) -
+    одной общей транзакцией при flush().
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Инициализация репозитория.
+
+        Args:
+            file_path: Путь к файлу базы данных SQLite
+        """
+        # Не вызываем super().__init__(): данные читаются из базы по запросу
+        self.file_path = file_path
+        self._init_state()
+        self._order_by = "id"
+        # Доступ к соединению из разных потоков (фоновая запись) защищен self._lock
+        self._conn = sqlite3.connect(file_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def _load_from_file(self):
+        """Переопределение абстрактного метода. Данные не загружаются в память"""
+        pass
+
+    def reload_from_file(self, force: bool = False) -> ReloadDiff:
+        """Переопределение метода reload_from_file. Каждый запрос и так читает актуальные данные"""
+        return ReloadDiff()
+
+    def write_all(self):
+        """b. Фиксация всех выполненных изменений (завершение текущей транзакции)"""
+        with self._lock:
+            self._conn.commit()
+
+    def _write_change(self, operation: str, client_id: Any, client: Optional[Client]):
+        """Изменение уже выполнено запросом - фиксируем транзакцию"""
+        self.write_all()
+
+    def close(self):
+        """Фиксация изменений и закрытие соединения"""
+        super().close()
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row_to_client(row: tuple) -> Client:
+        """Преобразование строки из базы в объект Client (дата хранится в формате ISO)"""
+        birth_date = row[4]
+        return Client.from_trusted(
+            row[0],
+            row[1],
+            row[2],
+            row[3],
+            date.fromisoformat(birth_date) if birth_date else None,
+            row[5],
+            row[6],
+            row[7],
+            row[8],
+        )
+
+    @staticmethod
+    def _client_params(client: Client) -> tuple:
+        """Значения колонок _DATA_COLUMNS для клиента"""
+        birth_date = client.get_birth_date()
+        surname_key, firstname_key, _, _ = client.identity_key
+        return (
+            client.get_surname(),
+            client.get_firstname(),
+            client.get_fathers_name(),
+            birth_date.isoformat() if birth_date else None,
+            client.get_phone_number(),
+            client.get_pasport(),
+            client.get_email(),
+            client.get_balance(),
+            surname_key,
+            firstname_key,
+            Client.normalize_email(client.get_email()),
+            Client.normalize_phone(client.get_phone_number()),
+            Client.normalize_pasport(client.get_pasport()),
+        )
+
+    def _query(self, query: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def read_all(self) -> List[Client]:
+        """
+        a. Получить все клиенты из базы в текущем порядке сортировки
+
+        Returns:
+            Список всех объектов Client
+        """
+        rows = self._query(f"SELECT {_COLUMNS} FROM clients ORDER BY {self._order_by}")
+        return [self._row_to_client(row) for row in rows]
+
+    def iter_all(self) -> Iterator[Client]:
+        """
+        Обход всех клиентов в текущем порядке сортировки порциями по _FETCH_SIZE строк,
+        без загрузки всей таблицы в память
+
+        Returns:
+            Генератор объектов Client
+        """
+        with self._lock:
+            cursor = self._conn.execute(f"SELECT {_COLUMNS} FROM clients ORDER BY {self._order_by}")
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(_FETCH_SIZE)
+                if not rows:
+                    return
+                for row in rows:
+                    yield self._row_to_client(row)
+        finally:
+            cursor.close()
+
+    def view(self) -> ClientListView:
+        """
+        Все клиенты в виде последовательности только для чтения
+
+        Returns:
+            Объект ClientListView
+        """
+        return ClientListView(self.read_all())
+
+    def get_frame(self):
+        """
+        Колоночное представление данных из базы (без кэширования, так как база может меняться извне)
+
+        Returns:
+            Объект ClientFrame
+        """
+        from travel_agency.ClientFrame import ClientFrame
+
+        return ClientFrame(self.read_all())
+
+    def get_by_id(self, client_id: int) -> Optional[Client]:
+        """
+        c. Получить объект по ID
+
+        Args:
+            client_id: ID клиента
+
+        Returns:
+            Объект Client или None, если не найден
+        """
+        rows = self._query(f"SELECT {_COLUMNS} FROM clients WHERE id = ?", (client_id,))
+        return self._row_to_client(rows[0]) if rows else None
+
+    def get_k_n_short_list(self, k: int, n: int) -> List[tuple]:
+        """
+        d. Получить список k по счету n объектов класса short (LIMIT/OFFSET в текущем порядке сортировки)
+
+        Args:
+            k: Номер страницы (начиная с 1)
+            n: Количество элементов на странице
+
+        Returns:
+            Список кортежей с краткой информацией о клиентах
+        """
+        rows = self._query(
+            f"SELECT {_SHORT_COLUMNS} FROM clients ORDER BY {self._order_by} LIMIT ? OFFSET ?",
+            (n, (k - 1) * n),
+        )
+        return [self._short_row(row) for row in rows]
+
+    @staticmethod
+    def _short_row(row: tuple) -> tuple:
+        """Строка _SHORT_COLUMNS в формате Client.short_information"""
+        client_id, surname, firstname, fathers_name, birth_date, email = row
+        # ISO (ГГГГ-ММ-ДД) -> ДД.ММ.ГГГГ
+        birth_date_str = f"{birth_date[8:10]}.{birth_date[5:7]}.{birth_date[:4]}" if birth_date else None
+        return client_id, surname, firstname, fathers_name, birth_date_str, email
+
+    def get_page_after(
+        self, cursor: Optional[str] = None, n: int = 20, order: str = "id"
+    ) -> Tuple[List[tuple], Optional[str]]:
+        """
+        Постраничный вывод по курсору: WHERE (ключ) > (курсор) ORDER BY ключ LIMIT n
+        (по первичному ключу или индексу idx_clients_surname, в который SQLite включает id)
+
+        Args:
+            cursor: Курсор из предыдущего вызова (None - первая страница)
+            n: Количество элементов на странице
+            order: Порядок страниц: "id" или "surname" (фамилия, затем ID)
+
+        Returns:
+            Пара (список кортежей с краткой информацией, курсор следующей страницы или None для последней)
+        """
+        after = decode_page_cursor(cursor, order)
+        fields = PAGE_ORDERS[order]
+        key = ", ".join(fields)
+        condition, params = "", ()
+        if after is not None:
+            condition = f"WHERE ({key}) > ({', '.join('?' * len(fields))})"
+            params = tuple(after)
+        # Лишняя строка показывает, есть ли следующая страница
+        rows = self._query(
+            f"SELECT {_SHORT_COLUMNS} FROM clients {condition} ORDER BY {key} LIMIT ?", params + (n + 1,)
+        )
+
+        next_cursor = None
+        if len(rows) > n:
+            rows = rows[:n]
+            columns = _SHORT_COLUMNS.split(", ")
+            next_cursor = encode_page_cursor(order, [rows[-1][columns.index(field)] for field in fields])
+        return [self._short_row(row) for row in rows], next_cursor
+
+    def sort_by_field(self, reverse: bool = False):
+        """Переопределение абстрактного метода - сортировка по фамилии"""
+        self.sort_by_surname(reverse)
+
+    def sort_by_surname(self, reverse: bool = False):
+        """
+        e. Сортировать элементы по выбранному полю (surname/фамилия).
+        Порядок применяется в запросах read_all и get_k_n_short_list (по индексу idx_clients_surname).
+
+        Args:
+            reverse: Если True, сортировка в обратном порядке
+        """
+        with self._lock:
+            self._order_by = "surname DESC, id" if reverse else "surname, id"
+            self._version += 1
+
+    def add_client(self, client: Client) -> Client:
+        """
+        f. Добавить объект в базу (ID формируется базой)
+
+        Args:
+            client: Объект Client для добавления
+
+        Returns:
+            Добавленный клиент с новым ID
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                f"INSERT INTO clients ({_DATA_COLUMNS}) VALUES ({', '.join('?' * 13)})", self._client_params(client)
+            )
+            new_client = Client.from_trusted(
+                cursor.lastrowid,
+                client.get_surname(),
+                client.get_firstname(),
+                client.get_fathers_name(),
+                client.get_birth_date(),
+                client.get_phone_number(),
+                client.get_pasport(),
+                client.get_email(),
+                client.get_balance(),
+            )
+            self._version += 1
+            self._persist_change("add", new_client.get_id(), new_client)
+            return new_client
+
+    def replace_by_id(self, client_id: int, new_client: Client) -> bool:
+        """
+        g. Заменить запись по ID
+
+        Args:
+            client_id: ID клиента для замены
+            new_client: Новый объект Client
+
+        Returns:
+            True если замена успешна, False если клиент не найден
+        """
+        assignments = ", ".join(f"{column} = ?" for column in _DATA_COLUMNS.split(", "))
+        with self._lock:
+            cursor = self._conn.execute(
+                f"UPDATE clients SET {assignments} WHERE id = ?", self._client_params(new_client) + (client_id,)
+            )
+            if cursor.rowcount == 0:
+                return False
+            self._version += 1
+            self._persist_change("replace", client_id, new_client)
+            return True
+
+    def delete_by_id(self, client_id: int) -> bool:
+        """
+        h. Удалить запись по ID
+
+        Args:
+            client_id: ID клиента для удаления
+
+        Returns:
+            True если удаление успешно, False если клиент не найден
+        """
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM clients WHERE id = ?", (client_id,))
+            if cursor.rowcount == 0:
+                return False
+            self._version += 1
+            self._persist_change("delete", client_id, None)
+            return True
+
+    def find_by_identity(self, surname: str, firstname: str, fathers_name=None, birth_date=None) -> List[Client]:
+        """
+        Найти клиентов по ФИО и дате рождения (индекс idx_clients_identity)
+
+        Args:
+            surname: Фамилия
+            firstname: Имя
+            fathers_name: Отчество
+            birth_date: Дата рождения (date)
+
+        Returns:
+            Список найденных клиентов
+        """
+        key = Client.make_identity_key(surname, firstname, fathers_name, birth_date)
+        rows = self._query(
+            f"SELECT {_COLUMNS} FROM clients WHERE surname_key IS ? AND firstname_key IS ? AND birth_date IS ?",
+            (key[0], key[1], birth_date.isoformat() if birth_date else None),
+        )
+        # Окончательное сравнение по нормализованному ключу (отчество)
+        clients = [self._row_to_client(row) for row in rows]
+        return [client for client in clients if client.identity_key == key]
+
+    def is_client_unique(self, client: Client) -> bool:
+        """
+        Проверка, что клиента с такими же ФИО и датой рождения еще нет в базе
+
+        Returns:
+            True если такого клиента нет
+        """
+        return not self.find_by_identity(
+            client.get_surname(), client.get_firstname(), client.get_fathers_name(), client.get_birth_date()
+        )
+
+    def _find_one_by(self, column: str, value) -> Optional[Client]:
+        """Поиск одного клиента по индексированной колонке нормализованного ключа"""
+        if value is None:
+            return None
+        rows = self._query(f"SELECT {_COLUMNS} FROM clients WHERE {column} = ? ORDER BY id LIMIT 1", (value,))
+        return self._row_to_client(rows[0]) if rows else None
+
+    def find_by_email(self, email: str) -> Optional[Client]:
+        """Найти клиента по email без учета регистра (индекс idx_clients_email)"""
+        return self._find_one_by("email_key", Client.normalize_email(email))
+
+    def find_by_phone(self, phone_number: str) -> Optional[Client]:
+        """Найти клиента по нормализованному телефону (индекс idx_clients_phone)"""
+        return self._find_one_by("phone_key", Client.normalize_phone(phone_number))
+
+    def find_by_passport(self, pasport: str) -> Optional[Client]:
+        """Найти клиента по паспорту, сравнивая только цифры (индекс idx_clients_pasport)"""
+        return self._find_one_by("pasport_key", Client.normalize_pasport(pasport))
+
+    def get_count(self) -> int:
+        """
+        i. Получить количество элементов
+
+        Returns:
+            Количество клиентов в базе
+        """
+        return self._query("SELECT COUNT(*) FROM clients")[0][0]
@@ -1,36 +1,93 @@
 import os
+from typing import Callable, Iterator, List, Optional
 
 import yaml
 
 from travel_agency.Client import Client
 from travel_agency.Client_rep_base import Client_rep_base
 
+# Реализация на C (libyaml) работает примерно на порядок быстрее, при ее отсутствии - чистый Python
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
 
 class Client_rep_yaml(Client_rep_base):
     """
     Класс для работы с данными клиентов в формате YAML.
     Обеспечивает чтение, запись, поиск, сортировку и управление объектами Client.
     Наследуется от Client_rep_base.
+
+    Поддерживаются два формата файла: один документ со списком клиентов (по умолчанию)
+    и поток документов "---", по одному клиенту в каждом (streaming=True).
+    При чтении формат определяется автоматически.
+
+    Повторное создание репозитория для того же файла возвращает общий экземпляр.
+    Незаданные (None) параметры берутся у него, заданные должны с ним совпадать.
     """
 
+    _shared_by_path = True
+
+    def __init__(self, file_path: str, streaming: Optional[bool] = None, snapshot: Optional[bool] = None):
+        """
+        Инициализация репозитория.
+
+        Args:
+            file_path: Путь к файлу для хранения данных
+            streaming: Если True, файл записывается потоком документов (по клиенту на документ, по умолчанию False)
+            snapshot: Если True, разобранные данные кэшируются в двоичном снимке рядом с файлом (по умолчанию False)
+
+        Raises:
+            ValueError: Если файл уже открыт с другими параметрами
+        """
+        if self._reuse_shared(streaming=streaming, snapshot=snapshot):
+            return
+        self.streaming = bool(streaming)
+        self.snapshot = bool(snapshot)
+        super().__init__(file_path)
+
+    def _iter_items(self) -> Iterator[dict]:
+        """Записи файла по мере разбора документов (оба формата файла)"""
+        with open(self.file_path, "r", encoding="utf-8") as f:
+            for document in yaml.load_all(f, Loader=_SafeLoader):
+                if isinstance(document, list):
+                    yield from document
+                elif document:
+                    yield document
+
     def _load_from_file(self):
-        """Чтение всех значений из файла"""
-        if os.path.exists(self.file_path):
-            try:
-                with open(self.file_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    if data:
-                        self._clients = [self._dict_to_client(item) for item in data]
-                    else:
-                        self._clients = []
-            except (yaml.YAMLError, FileNotFoundError):
-                self._clients = []
-        else:
-            self._clients = []
+        """Чтение всех значений из файла или его двоичного снимка (клиенты создаются по мере разбора документов)"""
+        clients = self._load_snapshot()
+        if clients is None:
+            clients = []
+            if os.path.exists(self.file_path):
+                try:
+                    clients = [self._dict_to_client(item) for item in self._iter_items()]
+                    self._save_snapshot(clients)
+                except (yaml.YAMLError, FileNotFoundError):
+                    clients = []
+        self._clients = clients
+        self._record_hashes = None
+
+    def _read_items(self) -> Optional[List[dict]]:
+        """Записи файла (для пословной перезагрузки)"""
+        if not os.path.exists(self.file_path):
+            return []
+        try:
+            items = list(self._iter_items())
+        except (yaml.YAMLError, FileNotFoundError):
+            return []
+        if any(item.get("id") is None for item in items):
+            # Записям без ID при загрузке выдаются новые ID - сопоставить их можно только полной загрузкой
+            return None
+        return items
 
     def _dict_to_client(self, data: dict) -> Client:
-        """Преобразование словаря в объект Client"""
-        return Client(
+        """Преобразование словаря из собственного файла в объект Client (без повторной валидации)"""
+        return Client.from_trusted(
             id=data.get("id"),
             surname=data.get("surname"),
             firstname=data.get("firstname"),
@@ -42,27 +99,26 @@ class Client_rep_yaml(Client_rep_base):
             balance=data.get("balance"),
         )
 
-    def _client_to_dict(self, client: Client) -> dict:
-        """Преобразование объекта Client в словарь"""
-        birth_date_str = client.get_birth_date().strftime("%d.%m.%Y") if client.get_birth_date() else None
-        return {
-            "id": client.get_id(),
-            "surname": client.get_surname(),
-            "firstname": client.get_firstname(),
-            "fathers_name": client.get_fathers_name(),
-            "birth_date": birth_date_str,
-            "phone_number": client.get_phone_number(),
-            "pasport": client.get_pasport(),
-            "email": client.get_email(),
-            "balance": client.get_balance(),
-        }
-
     def write_all(self):
         """b. Запись всех значений в файл"""
-        data = [self._client_to_dict(client) for client in self._clients]
+        self._write_clients(self._clients)
+
+    def _write_clients(self, clients: List[Client]):
+        """Запись списка клиентов в файл"""
+        with self._write_lock:
+            data = [self._client_to_dict(client) for client in clients]
+
+            options = {"Dumper": _SafeDumper, "allow_unicode": True, "default_flow_style": False, "sort_keys": False}
+            if self.streaming:
+                self._atomic_write(lambda f: yaml.dump_all(data, f, explicit_start=True, **options))
+            else:
+                self._atomic_write(lambda f: yaml.dump(data, f, **options))
+            self._save_snapshot(clients)
 
-        with open(self.file_path, "w", encoding="utf-8") as f:
-            yaml.dump(data, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+    def _snapshot_changes(self) -> Optional[Callable[[], None]]:
+        """Копия списка (только ссылки на неизменяемые клиенты) - сериализация и запись вне блокировки"""
+        clients = list(self._clients)
+        return lambda: self._write_clients(clients)
 
     def sort_by_field(self, reverse: bool = False):
         """Переопределение абстрактного метода - сортировка по фамилии"""
@@ -75,4 +131,4 @@ class Client_rep_yaml(Client_rep_base):
         Args:
             reverse: Если True, сортировка в обратном порядке
         """
-        self._clients.sort(key=lambda client: client.get_surname() if client.get_surname() else "", reverse=reverse)
+        self._sort_clients(lambda client: client.get_surname() if client.get_surname() else "", reverse)
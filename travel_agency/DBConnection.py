@@ -1,18 +1,25 @@
 import threading
-from typing import Optional
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
 
 import psycopg2
+from psycopg2 import extensions, pool
 
 
 class DBConnection:
     """
     Паттерн Одиночка (Singleton) для управления подключением к БД PostgreSQL.
     Обеспечивает единственное подключение к базе данных для всего приложения.
+
+    В режиме пула (enable_pool) каждый поток получает собственное соединение из пула:
+    на время блока with connection() или от get_connection() до release_connection().
     """
 
     _instance: Optional["DBConnection"] = None
     _lock = threading.Lock()
     _connection = None
+    _pool: Optional[pool.ThreadedConnectionPool] = None
 
     def __new__(cls):
         """Гарантирует создание только одного экземпляра класса"""
@@ -24,7 +31,7 @@ class DBConnection:
 
     def __init__(self):
         """Инициализация подключения (выполняется только один раз)"""
-        if self._connection is None:
+        if self._connection is None and self._pool is None:
             # Захардкоженные параметры подключения к БД
             self._host = "localhost"
             self._port = 5433
@@ -61,19 +68,209 @@ class DBConnection:
                 print(f"✗ Ошибка подключения к БД: {e}")
                 raise
 
+    def enable_pool(
+        self,
+        min_size: int = 1,
+        max_size: int = 10,
+        idle_check_interval: float = 30.0,
+        checkout_timeout: float = 30.0,
+    ):
+        """
+        Включение пула соединений (ThreadedConnectionPool) вместо одного общего соединения.
+        Потоки выполняют запросы параллельно, а откат транзакции в одном потоке не затрагивает другие.
+
+        Args:
+            min_size: Количество соединений, которые пул держит открытыми
+            max_size: Максимальное количество одновременно выданных соединений
+            idle_check_interval: Соединение, простаивавшее дольше (секунды), перед выдачей проверяется запросом SELECT 1
+            checkout_timeout: Время ожидания свободного соединения в секундах
+        """
+        with self._lock:
+            if self._pool is not None:
+                return
+            try:
+                self._pool = pool.ThreadedConnectionPool(
+                    min_size,
+                    max_size,
+                    host=self._host,
+                    port=self._port,
+                    database=self._database,
+                    user=self._user,
+                    password=self._password,
+                )
+            except psycopg2.Error as e:
+                print(f"✗ Ошибка создания пула соединений: {e}")
+                raise
+            self.min_size = min_size
+            self.max_size = max_size
+            self.idle_check_interval = idle_check_interval
+            self.checkout_timeout = checkout_timeout
+            # Семафор ограничивает выдачу: getconn() пула при исчерпании сразу выбрасывает ошибку, а не ждет
+            self._slots = threading.BoundedSemaphore(max_size)
+            self._local = threading.local()
+            self._stats_lock = threading.Lock()
+            # Время возврата соединения в пул (по id объекта) для проверки простаивавших
+            self._returned_at: Dict[int, float] = {}
+            self._stats = {"checkouts": 0, "in_use": 0, "waits": 0, "timeouts": 0, "health_check_failures": 0}
+            print(f"✓ Пул соединений с БД {self._database} создан ({min_size}-{max_size})")
+
+    def _count(self, name: str, delta: int = 1):
+        with self._stats_lock:
+            self._stats[name] += delta
+
+    def _is_healthy(self, conn) -> bool:
+        """Проверка соединения из пула: закрытые отбрасываются, простаивавшие проверяются запросом"""
+        if conn.closed:
+            return False
+        returned_at = self._returned_at.get(id(conn))
+        if returned_at is None or time.monotonic() - returned_at < self.idle_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except psycopg2.Error:
+            self._count("health_check_failures")
+            return False
+
+    def _checkout(self):
+        """Получение исправного соединения из пула (с ожиданием, если все заняты)"""
+        if not self._slots.acquire(blocking=False):
+            self._count("waits")
+            if not self._slots.acquire(timeout=self.checkout_timeout):
+                self._count("timeouts")
+                raise pool.PoolError(f"Нет свободных соединений в пуле (ожидание {self.checkout_timeout} с)")
+        try:
+            while True:
+                conn = self._pool.getconn()
+                if self._is_healthy(conn):
+                    break
+                self._discard(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+        self._count("checkouts")
+        self._count("in_use")
+        return conn
+
+    def _discard(self, conn):
+        self._returned_at.pop(id(conn), None)
+        self._pool.putconn(conn, close=True)
+
+    def _release(self, conn, failed: bool = False):
+        """
+        Возврат соединения в пул: незавершенная транзакция фиксируется
+        (или откатывается, если блок завершился ошибкой)
+        """
+        try:
+            if not conn.closed and conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+                if failed:
+                    conn.rollback()
+                else:
+                    conn.commit()
+            broken = bool(conn.closed)
+        except psycopg2.Error:
+            broken = True
+        finally:
+            self._count("in_use", -1)
+            self._slots.release()
+
+        if broken:
+            self._discard(conn)
+            return
+        self._returned_at[id(conn)] = time.monotonic()
+        self._pool.putconn(conn)
+        # Соединения сверх min_size пул закрывает при возврате
+        if conn.closed:
+            self._returned_at.pop(id(conn), None)
+
+    @contextmanager
+    def connection(self):
+        """
+        Соединение на время блока with.
+        В режиме пула вложенные блоки и get_connection() в том же потоке используют одно соединение;
+        при выходе из внешнего блока транзакция фиксируется (при исключении - откатывается)
+        и соединение возвращается в пул. Без пула выдается общее соединение.
+
+        Пример:
+            with db.connection() as conn:
+                ...
+        """
+        if self._pool is None:
+            yield self.get_connection()
+            return
+
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = self._checkout()
+            local.conn, local.depth, local.pinned = conn, 0, False
+        local.depth += 1
+        failed = False
+        try:
+            yield conn
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            local.depth -= 1
+            if local.depth == 0 and not local.pinned:
+                local.conn = None
+                self._release(conn, failed)
+
     def get_connection(self):
         """
-        Получение активного подключения
+        Получение активного подключения.
+        В режиме пула соединение закрепляется за текущим потоком до вызова release_connection().
 
         Returns:
             Объект подключения psycopg2
         """
+        if self._pool is not None:
+            local = self._local
+            if getattr(local, "conn", None) is None:
+                local.conn, local.depth = self._checkout(), 0
+            local.pinned = True
+            return local.conn
+
         if self._connection is None or self._connection.closed:
             self.connect()
         return self._connection
 
+    def release_connection(self):
+        """Возврат в пул соединения, закрепленного за потоком вызовом get_connection()"""
+        if self._pool is None:
+            return
+        local = self._local
+        conn = getattr(local, "conn", None)
+        if conn is None or not local.pinned:
+            return
+        local.pinned = False
+        if local.depth == 0:
+            local.conn = None
+            self._release(conn)
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Статистика пула соединений
+
+        Returns:
+            Словарь: min_size, max_size, in_use (выдано сейчас), checkouts (всего выдач), waits (выдач с ожиданием),
+            timeouts, health_check_failures; пустой словарь, если пул не включен
+        """
+        if self._pool is None:
+            return {}
+        with self._stats_lock:
+            return {"min_size": self.min_size, "max_size": self.max_size, **self._stats}
+
     def close(self):
-        """Закрытие соединения с БД"""
+        """Закрытие соединения с БД (и всех соединений пула)"""
+        if self._pool is not None:
+            with self._lock:
+                self._pool.closeall()
+                self._pool = None
+            print("✓ Пул соединений с БД закрыт")
         if self._connection is not None and not self._connection.closed:
             self._connection.close()
             print("✓ Соединение с БД закрыто")
@@ -90,25 +287,25 @@ class DBConnection:
         Returns:
             Результат запроса или None
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(query, params)
+            try:
+                cursor.execute(query, params)
 
-            if fetch:
-                result = cursor.fetchall()
-                cursor.close()
-                return result
-            else:
-                conn.commit()
-                cursor.close()
-                return None
+                if fetch:
+                    result = cursor.fetchall()
+                    cursor.close()
+                    return result
+                else:
+                    conn.commit()
+                    cursor.close()
+                    return None
 
-        except psycopg2.Error as e:
-            conn.rollback()
-            cursor.close()
-            raise Exception(f"Ошибка выполнения запроса: {e}")
+            except psycopg2.Error as e:
+                conn.rollback()
+                cursor.close()
+                raise Exception(f"Ошибка выполнения запроса: {e}")
 
     def execute_query_one(self, query: str, params: tuple = None):
         """
@@ -121,21 +318,21 @@ class DBConnection:
         Returns:
             Одна запись или None
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute(query, params)
-            result = cursor.fetchone()
+            try:
+                cursor.execute(query, params)
+                result = cursor.fetchone()
 
-            # Если это INSERT/UPDATE/DELETE с RETURNING - нужен commit
-            if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
-                conn.commit()
+                # Если это INSERT/UPDATE/DELETE с RETURNING - нужен commit
+                if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
+                    conn.commit()
 
-            cursor.close()
-            return result
+                cursor.close()
+                return result
 
-        except psycopg2.Error as e:
-            conn.rollback()
-            cursor.close()
-            raise Exception(f"Ошибка выполнения запроса: {e}")
+            except psycopg2.Error as e:
+                conn.rollback()
+                cursor.close()
+                raise Exception(f"Ошибка выполнения запроса: {e}")
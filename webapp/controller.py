@@ -4,6 +4,7 @@ from travel_agency.Client import Client
 from travel_agency.Client_rep_decorator import (
     BalanceFilter,
     Client_rep_decorator,
+    ClientSorter,
     EmailFilter,
     SurnameFilter,
 )
@@ -28,8 +29,6 @@ class ClientController(RepositoryObserver):
 
     def get_clients_overview(self, filters: Dict[str, Any] | None = None) -> List[Dict[str, Any]]:
         """Возвращает краткую информацию о клиентах для таблицы с фильтрацией."""
-        self._last_payload.pop("clients_loaded", None)
-
         if filters:
             decorated = Client_rep_decorator(self.repository)
             min_balance = filters.get("min_balance")
@@ -59,10 +58,9 @@ class ClientController(RepositoryObserver):
             elif sorter == "email_desc":
                 decorated.set_sorter(ClientSorter.by_email(True))
 
-            clients = decorated.read_all()
+            clients = decorated.iter_all()
         else:
-            self.repository.read_all()
-            clients = self._last_payload.get("clients_loaded", [])
+            clients = self.repository.iter_all()
 
         return [self._short_dto(client) for client in clients]
 
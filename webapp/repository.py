@@ -1,6 +1,7 @@
-from typing import Any, List, Optional
+from typing import Any, Iterator, List, Optional
 
 from travel_agency.Client import Client
+from travel_agency.Client_rep_base import ClientListView
 from travel_agency.Client_rep_DB_adapter import Client_rep_DB_adapter
 
 from .observer import ObservableRepositoryMixin
@@ -14,6 +15,20 @@ class ObservableClientRepository(ObservableRepositoryMixin, Client_rep_DB_adapte
         self._notify("clients_loaded", clients)
         return clients
 
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Client]:
+        # Наблюдателям передается только количество строк: сам генератор
+        # одноразовый и держит курсор БД, делить его между подписчиками нельзя
+        count = 0
+        for client in super().iter_all(batch_size):
+            count += 1
+            yield client
+        self._notify("clients_iterated", count)
+
+    def view(self) -> ClientListView:
+        clients = super().view()
+        self._notify("clients_loaded", clients)
+        return clients
+
     def get_by_id(self, client_id: Any) -> Optional[Client]:
         client = super().get_by_id(client_id)
         self._notify("client_loaded", client)